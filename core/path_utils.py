@@ -6,6 +6,7 @@ Consistent path handling for the tester framework.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
 def get_tester_root():
@@ -21,10 +22,13 @@ def get_tester_root():
     # The tester directory is the parent of core
     return core_dir.parent
 
+@lru_cache(maxsize=256)
 def resolve_path(relative_path):
     """
     Resolve a path relative to the tester root directory.
     
+    Results are cached; the tester root never moves during a run.
+    
     Args:
         relative_path (str): Path relative to tester root
         
@@ -9,12 +9,79 @@ Provides a foundation for implementing test cases.
 import inspect
 import traceback
 import time
+from contextlib import contextmanager
 from pathlib import Path
+import requests
 from core.logger import get_logger, log_test_start, log_test_result, set_saved_source_file
 
+def parametrize(arg_names, cases, ids=None):
+    """
+    Declare a test method as parametrized.
+    
+    Each case is expanded into its own test method named `<method>_<id>` when
+    the TestCase subclass is created, so every case is run, reported and
+    selectable with --test independently.
+    
+    Args:
+        arg_names (str): Comma-separated names of the test method arguments
+        cases (list): Argument values, one tuple (or single value) per case
+        ids (list, optional): Method name suffix per case, defaults to the case index
+        
+    Returns:
+        callable: Decorator marking the test method for expansion
+    """
+    names = [name.strip() for name in arg_names.split(',')]
+    if ids is None:
+        ids = [str(index) for index in range(len(cases))]
+    
+    def decorator(func):
+        func.parametrize_cases = [
+            (case_id, dict(zip(names, case if len(names) > 1 else (case,))))
+            for case_id, case in zip(ids, cases)
+        ]
+        return func
+    
+    return decorator
+
+def _make_parametrized_case(func, name, index, kwargs):
+    """
+    Build a single test method bound to one set of parametrize arguments.
+    
+    Args:
+        func (callable): Parametrized test function
+        name (str): Name of the generated test method
+        index (int): Position of the case, used to keep definition order
+        kwargs (dict): Arguments passed to func
+        
+    Returns:
+        callable: Test method taking only self
+    """
+    def case(self):
+        return func(self, **kwargs)
+    
+    case.__name__ = case.__qualname__ = name
+    case.__doc__ = func.__doc__
+    # inspect.getsource/getsourcelines follow __wrapped__ back to the original definition
+    case.__wrapped__ = func
+    case.parametrize_index = index
+    return case
+
 class TestCase:
     """Base class for test cases."""
     
+    def __init_subclass__(cls, **kwargs):
+        """Expand @parametrize test methods into one test method per case."""
+        super().__init_subclass__(**kwargs)
+        for name, func in list(vars(cls).items()):
+            cases = getattr(func, 'parametrize_cases', None)
+            if cases is None:
+                continue
+            
+            delattr(cls, name)
+            for index, (case_id, case_kwargs) in enumerate(cases):
+                case_name = f"{name}_{case_id}"
+                setattr(cls, case_name, _make_parametrized_case(func, case_name, index, case_kwargs))
+    
     def __init__(self, runner):
         """
         Initialize the test case.
@@ -41,6 +108,76 @@ class TestCase:
         """
         pass
     
+    def setup_suite(self):
+        """
+        Set up state shared by every test in this test case.
+        Called once before the first test runs.
+        """
+        pass
+    
+    def teardown_suite(self):
+        """
+        Clean up state created by setup_suite.
+        Called once after the last test, regardless of outcome.
+        """
+        pass
+    
+    def open_session(self, pool_maxsize, pool_connections=1, timeout=None):
+        """
+        Open the keep-alive session that _request sends through.
+        
+        Called from setup_suite; teardown_suite closes self.session.
+        
+        Args:
+            pool_maxsize (int): Connections kept open per host
+            pool_connections (int): Number of per-host connection pools to cache
+            timeout (float or tuple, optional): Default request timeout, the runner's timeout if not given
+        """
+        self.session = self.runner.create_session(pool_maxsize, pool_connections)
+        self._session_timeout = self.runner.timeout if timeout is None else timeout
+    
+    def _request(self, method, path, **kwargs):
+        """
+        Send a request to the server under test through the shared session.
+        
+        Args:
+            method (str): HTTP method
+            path (str): URL path
+            **kwargs: Additional arguments to pass to requests
+            
+        Returns:
+            requests.Response: HTTP response object
+        """
+        kwargs.setdefault('timeout', self._session_timeout)
+        return self.session.request(method, self.runner.base_url + path, **kwargs)
+    
+    def _send_all(self, executor, calls, send=None):
+        """
+        Send independent requests concurrently through the shared session.
+        
+        Assertions must stay on the calling thread, so this only collects
+        the outcomes; callers check them in order afterwards.
+        
+        Args:
+            executor (concurrent.futures.Executor): Executor the requests are submitted to
+            calls (list): (method, path, kwargs) tuples
+            send (callable, optional): Called as send(method, path, **kwargs) for each call, defaults to _request
+            
+        Returns:
+            list: (response, error) pairs in the order of calls; one of the two is always None
+        """
+        send = send or self._request
+        futures = [executor.submit(send, method, path, **kwargs)
+                   for method, path, kwargs in calls]
+        
+        results = []
+        for future in futures:
+            try:
+                results.append((future.result(), None))
+            except requests.RequestException as e:
+                results.append((None, e))
+        return results
+    
     def get_test_methods(self):
         """
         Get all test methods in this test case.
@@ -52,8 +189,10 @@ class TestCase:
         methods = [method for name, method in inspect.getmembers(self, predicate=inspect.ismethod)
                   if name.startswith('test_')]
         
-        # Sort by line number in source code to maintain definition order
-        methods.sort(key=lambda method: inspect.getsourcelines(method)[1])
+        # Sort by line number in source code to maintain definition order,
+        # keeping parametrized cases in the order they were declared
+        methods.sort(key=lambda method: (inspect.getsourcelines(method)[1],
+                                         getattr(method, 'parametrize_index', 0)))
         
         return methods
     
@@ -63,8 +202,7 @@ class TestCase:
         
         # No sorting needed here anymore, as get_test_methods already returns methods in source order
         
-        for method in test_methods:
-            self.run_test(method, save_source_on_failure=False)
+        self._run_suite(test_methods, save_source_on_failure=False)
     
     def run_single_test(self, test_name):
         """
@@ -81,12 +219,64 @@ class TestCase:
         
         try:
             method = getattr(self, test_name)
-            # Run the test with the flag to save the source code if it fails
-            self.run_test(method, save_source_on_failure=True)
-            return True
         except AttributeError:
             self.logger.error(f"Test '{test_name}' not found in {self.__class__.__name__}")
             return False
+        
+        # Run the test with the flag to save the source code if it fails
+        self._run_suite([method], save_source_on_failure=True)
+        return True
+    
+    def _run_suite(self, test_methods, save_source_on_failure):
+        """
+        Run test methods between setup_suite and teardown_suite.
+        
+        If setup_suite raises, the error is recorded as a failure of this test
+        case, its tests are skipped and teardown_suite still runs, so later
+        test cases are unaffected.
+        
+        Args:
+            test_methods (list): Test methods to run
+            save_source_on_failure (bool): Whether to save the source code on failure
+        """
+        set_up = False
+        try:
+            set_up = self._setup_suite_succeeded()
+            if set_up:
+                for method in test_methods:
+                    self.run_test(method, save_source_on_failure=save_source_on_failure)
+        finally:
+            try:
+                self.teardown_suite()
+            except Exception as e:
+                # After a failed setup_suite, partially built state is expected
+                # and the failure has already been reported
+                log = self.logger.error if set_up else self.logger.debug
+                log(f"Exception in teardown_suite for {self.__class__.__name__}: {e}")
+    
+    def _setup_suite_succeeded(self):
+        """
+        Call setup_suite, recording a failure if it raises.
+        
+        Returns:
+            bool: True if setup_suite completed, False otherwise
+        """
+        start_time = time.time()
+        try:
+            self.setup_suite()
+            return True
+        except Exception as e:
+            duration = time.time() - start_time
+            error_msg = f"setup_suite failed: {e}"
+            
+            self.logger.debug(f"Exception in {self.__class__.__name__}.setup_suite: {e}")
+            self.logger.debug(traceback.format_exc())
+            
+            log_test_start(self.category_name, "Setup Suite")
+            self.runner.results.start_test(f"{self.__class__.__name__}.setup_suite")
+            self.runner.results.fail_test(error_msg)
+            log_test_result(self.category_name, "Setup Suite", False, duration, error_msg)
+            return False
     
     def run_test(self, test_method, save_source_on_failure=False):
         """
@@ -187,6 +377,34 @@ class TestCase:
         except Exception as save_error:
             self.logger.debug(f"Failed to save test source: {save_error}")
                             
+    def fail(self, message="Test failed"):
+        """
+        Fail the current test unconditionally.
+        
+        Args:
+            message (str): Error message
+            
+        Raises:
+            AssertionError: Always
+        """
+        raise AssertionError(message)
+    
+    @contextmanager
+    def expect_success(self, description):
+        """
+        Turn a request error raised inside the block into a test failure.
+        
+        Args:
+            description (str): What the block is doing, used in the failure message
+            
+        Raises:
+            AssertionError: If a requests.RequestException is raised inside the block
+        """
+        try:
+            yield
+        except requests.RequestException as e:
+            self.fail(f"Request failed: {description}: {e}")
+    
     def assert_true(self, condition, message="Assertion failed"):
         """
         Assert that a condition is true.
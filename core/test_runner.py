@@ -6,13 +6,73 @@ Manages the execution of test cases against the webserver.
 Provides utility methods for sending requests and validating responses.
 """
 
+import errno
+import http.client
+import os
 import requests
+import selectors
 import socket
 import time
+from collections import namedtuple
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 from urllib.parse import urljoin
 from core.logger import get_logger
 
+# Status line, headers and body length of one response read off a raw connection
+RawResponse = namedtuple('RawResponse', ['status', 'headers', 'body_size'])
+
+# Final statuses whose responses never carry a body, whatever their headers say
+BODYLESS_STATUSES = frozenset({204, 304})
+
+def read_response(reader):
+    """
+    Read one HTTP/1.1 response from a raw connection, discarding its body.
+    
+    The body is delimited by chunked framing or Content-Length. A response
+    with neither runs until the server closes the connection (RFC 7230
+    Section 3.3.3), so it can only be the last response on that connection.
+    
+    Args:
+        reader (io.BufferedReader): Buffered reader over the connection socket
+        
+    Returns:
+        RawResponse: Status code, headers and number of body bytes read
+        
+    Raises:
+        ConnectionError: If the server closed the connection before the response
+        ValueError: If the status line or chunk framing is malformed
+        http.client.HTTPException: If the header block can't be parsed
+    """
+    status_line = reader.readline()
+    if not status_line:
+        raise ConnectionError("Connection closed before all pipelined responses were received")
+    status = int(status_line.split(None, 2)[1])
+    headers = http.client.parse_headers(reader)
+    
+    if status < 200 or status in BODYLESS_STATUSES:
+        return RawResponse(status, headers, 0)
+    
+    # Read past the body so the next response starts at the right byte
+    body_size = 0
+    if 'chunked' in headers.get('Transfer-Encoding', '').lower():
+        while True:
+            chunk_size = int(reader.readline().split(b';')[0], 16)
+            if chunk_size == 0:
+                # Skip optional trailers up to the terminating blank line
+                while reader.readline() not in (b'\r\n', b'\n', b''):
+                    pass
+                break
+            body_size += len(reader.read(chunk_size))
+            reader.readline()
+    elif headers.get('Content-Length') is not None:
+        body_size = len(reader.read(int(headers['Content-Length'])))
+    else:
+        for chunk in iter(lambda: reader.read(65536), b''):
+            body_size += len(chunk)
+    
+    return RawResponse(status, headers, body_size)
+
 class TestRunner:
     """Handles execution of test cases against the webserver."""
     
@@ -111,12 +171,33 @@ class TestRunner:
             self.logger.debug(f"Request failed: {e}")
             raise
     
+    def create_session(self, pool_maxsize, pool_connections=1):
+        """
+        Create a keep-alive session for requests to the server under test.
+        
+        Unlike send_request, which connects afresh for every request, the
+        session keeps connections open and reuses them. Failed requests are
+        never retried, so tests see the server's first answer.
+        
+        Args:
+            pool_maxsize (int): Connections kept open per host
+            pool_connections (int): Number of per-host connection pools to cache
+            
+        Returns:
+            requests.Session: Session with one adapter mounted for http and https
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=0)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+    
     def send_raw_request(self, raw_request, path=None):
         """
         Send a raw HTTP request to the server.
         
         Args:
-            raw_request (str): Raw HTTP request
+            raw_request (str or bytes): Raw HTTP request; bytes are sent as-is
             path (str, optional): URL path (used for logging)
             
         Returns:
@@ -134,7 +215,7 @@ class TestRunner:
             sock.connect((self.host, self.port))
             
             # Send request
-            sock.sendall(raw_request.encode('utf-8'))
+            sock.sendall(raw_request if isinstance(raw_request, bytes) else raw_request.encode('utf-8'))
             
             # Receive response
             response = b''
@@ -152,6 +233,86 @@ class TestRunner:
             self.logger.debug(f"Socket error: {e}")
             raise
     
+    def send_raw_requests(self, raw_requests):
+        """
+        Send several raw HTTP requests at once, each on its own connection.
+        
+        Every connection is opened and written before any response is read, and
+        one selector drives all of them, so the batch costs about one round trip
+        instead of one per request.
+        
+        Args:
+            raw_requests (list): Raw HTTP requests (str or bytes); bytes are sent as-is
+            
+        Returns:
+            list: (response, error) pairs in request order; response is the raw HTTP
+                  response as returned by send_raw_request, error the socket.error that
+                  ended that connection. One of the two is always None.
+        """
+        self.logger.debug(f"Sending {len(raw_requests)} raw requests to {self.host}:{self.port}")
+        
+        results = [None] * len(raw_requests)
+        selector = selectors.DefaultSelector()
+        
+        try:
+            # Start every connect without waiting for the handshakes
+            for i, raw_request in enumerate(raw_requests):
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                sock.setblocking(False)
+                err = sock.connect_ex((self.host, self.port))
+                if err not in (0, errno.EINPROGRESS):
+                    sock.close()
+                    results[i] = (None, OSError(err, os.strerror(err)))
+                    continue
+                if not isinstance(raw_request, bytes):
+                    raw_request = raw_request.encode('utf-8')
+                # Per connection: [request index, bytes left to send, bytes received]
+                selector.register(sock, selectors.EVENT_WRITE, [i, raw_request, bytearray()])
+            
+            while selector.get_map():
+                events = selector.select(timeout=self.timeout)
+                if not events:
+                    # Nothing moved within the timeout; fail whatever is still open
+                    for key in list(selector.get_map().values()):
+                        selector.unregister(key.fileobj)
+                        key.fileobj.close()
+                        results[key.data[0]] = (None, socket.timeout("timed out"))
+                    break
+                
+                for key, mask in events:
+                    sock, state = key.fileobj, key.data
+                    try:
+                        if mask & selectors.EVENT_WRITE:
+                            # Surface a failed non-blocking connect
+                            err = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                            if err:
+                                raise OSError(err, os.strerror(err))
+                            state[1] = state[1][sock.send(state[1]):]
+                            if not state[1]:
+                                selector.modify(sock, selectors.EVENT_READ, state)
+                            continue
+                        
+                        chunk = sock.recv(4096)
+                        if chunk:
+                            state[2] += chunk
+                            continue
+                        # Server closed the connection: the response is complete
+                        results[state[0]] = (state[2].decode('utf-8'), None)
+                    except (BlockingIOError, InterruptedError):
+                        continue
+                    except socket.error as e:
+                        self.logger.debug(f"Socket error: {e}")
+                        results[state[0]] = (None, e)
+                    
+                    selector.unregister(sock)
+                    sock.close()
+        finally:
+            for key in list(selector.get_map().values()):
+                key.fileobj.close()
+            selector.close()
+        
+        return results
+    
     def check_status_code(self, response, expected_code):
         """
         Check if response has the expected status code.
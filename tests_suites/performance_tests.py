@@ -6,15 +6,27 @@ Tests for server performance under load according to test.conf configuration.
 Verifies handling of concurrent connections, resource utilization, and stability.
 """
 
+import asyncio
+import http.client
 import requests
+import socket
 import time
-import random
 import threading
 import psutil
 import os
 import statistics
-from concurrent.futures import ThreadPoolExecutor
+from array import array
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from core.test_case import TestCase
+from core.test_runner import read_response
+
+# Common server executable names used to locate the server process
+SERVER_NAMES = ('webserv', 'httpd', 'nginx')
+
+# Linux exposes RSS directly in /proc/<pid>/statm (in pages), which is much
+# cheaper to read than going through psutil for every sample
+HAS_PROC_STATM = os.path.exists('/proc/self/statm')
+PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if HAS_PROC_STATM else None
 
 class PerformanceTests(TestCase):
     """Tests server performance under various load conditions."""
@@ -24,12 +36,31 @@ class PerformanceTests(TestCase):
         # Define the test path that returns predictable content
         self.test_path = '/index.html'
         
+        # Request targets are built per request by appending the index only
+        self._path_prefix = self.test_path + '?req='
+        self._url_prefix = self.runner.get_url(self._path_prefix)
+        
         # Performance test parameters - using more demanding values for better performance validation
         self.num_concurrent = 500     # Number of concurrent connections in concurrency tests
         self.num_requests = 1000      # Total number of requests for load tests
         self.burst_size = 20         # Number of connections in a burst
         self.request_timeout = 0.1     # Timeout for requests in seconds
         
+        # Cap tester threads by CPU count so the tester's own scheduling overhead
+        # doesn't dominate measured latency; request counts are unaffected
+        self.max_workers = min(self.num_concurrent, (os.cpu_count() or 4) * 8)
+        
+        # Route all load traffic through one pooled session so sockets are kept
+        # alive and reused instead of opening a new connection per request
+        self.session = self.runner.create_session(self.max_workers)
+        
+        # Discarded warm-up request so name resolution and the first TCP handshake
+        # aren't rolled into the first measured response time
+        try:
+            self.session.get(self.runner.get_url(self.test_path), timeout=1.0)
+        except requests.exceptions.RequestException as e:
+            self.logger.debug(f"Warm-up request failed: {e}")
+        
         # Get server process for resource monitoring
         try:
             self.server_pid = self._find_server_process()
@@ -40,95 +71,136 @@ class PerformanceTests(TestCase):
         except Exception as e:
             self.logger.debug(f"Error finding server process: {e}")
             self.server_pid = None
+        
+        # Cache process handles - the server PID doesn't change during a test
+        self._proc = None
+        self._children = []
+        if self.server_pid:
+            try:
+                self._proc = psutil.Process(self.server_pid)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                self.logger.debug(f"Server process {self.server_pid} is not accessible")
+    
+    def teardown(self):
+        """Clean up performance test environment."""
+        self.session.close()
     
     def _find_server_process(self):
         """Find the server process ID based on common server executable names."""
-        # Look for common server executable names
-        server_names = ["webserv", "httpd", "nginx"]
-        
         for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
             try:
-                # Check for known server names
-                # Check in process name if available
-                proc_name = proc.info.get('name', '')
-                if proc_name and isinstance(proc_name, str):
+                # Check in process name first - the common case
+                proc_name = proc.info['name']
+                if isinstance(proc_name, str):
                     proc_name = proc_name.lower()
-                    for server_name in server_names:
-                        if server_name in proc_name:
-                            return proc.info['pid']
+                    if any(server_name in proc_name for server_name in SERVER_NAMES):
+                        return proc.info['pid']
                 
-                # Check in command line arguments if available
-                cmdline = proc.info.get('cmdline', [])
-                if cmdline and isinstance(cmdline, (list, tuple)):
-                    cmdline_str = ' '.join(cmdline).lower()
-                    for server_name in server_names:
-                        if server_name in cmdline_str:
-                            return proc.info['pid']
+                # Fall back to command line arguments, without joining them
+                cmdline = proc.info['cmdline']
+                if isinstance(cmdline, (list, tuple)) and any(
+                        server_name in part.lower() for part in cmdline for server_name in SERVER_NAMES):
+                    return proc.info['pid']
             except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess, TypeError, AttributeError):
                 continue
         
         # Default to None if we can't find the server process
         return None
     
+    def _refresh_children(self):
+        """Re-enumerate the child processes of the cached server process."""
+        try:
+            self._children = self._proc.children(recursive=True)
+        except (psutil.NoSuchProcess, psutil.AccessDenied, AttributeError):
+            # Some systems might not support children() method
+            self._children = []
+    
+    def _get_rss(self, process):
+        """
+        Get the Resident Set Size of a process.
+        
+        Args:
+            process (psutil.Process): Process to sample
+            
+        Returns:
+            int: Resident Set Size in bytes
+            
+        Raises:
+            psutil.NoSuchProcess: If the process no longer exists
+            psutil.AccessDenied: If the process can't be inspected
+        """
+        if not HAS_PROC_STATM:
+            return process.memory_info().rss
+        
+        try:
+            with open(f'/proc/{process.pid}/statm', 'rb') as f:
+                return int(f.read().split()[1]) * PAGE_SIZE
+        except FileNotFoundError:
+            raise psutil.NoSuchProcess(process.pid)
+        except PermissionError:
+            raise psutil.AccessDenied(process.pid)
+    
     def _get_memory_usage(self):
-        """Get memory usage of the server process."""
-        if self.server_pid:
+        """
+        Get memory usage of the server process and all of its children.
+        
+        Children are re-enumerated on every sample so workers or CGI processes
+        forked under load are counted too.
+        """
+        if self._proc is None:
+            return None
+        
+        try:
+            memory_usage = self._get_rss(self._proc)
+        except (psutil.NoSuchProcess, psutil.AccessDenied, AttributeError):
+            return None
+        
+        # Add children's memory usage
+        self._refresh_children()
+        for child in self._children:
             try:
-                # Get process and all children
-                process = psutil.Process(self.server_pid)
-                
-                # Sum up memory usage from main process and all children
-                memory_info = process.memory_info()
-                memory_usage = memory_info.rss  # Resident Set Size in bytes
-                
-                # Add children's memory usage
-                try:
-                    for child in process.children(recursive=True):
-                        try:
-                            child_memory = child.memory_info().rss
-                            memory_usage += child_memory
-                        except (psutil.NoSuchProcess, psutil.AccessDenied):
-                            continue
-                except (psutil.NoSuchProcess, psutil.AccessDenied, AttributeError):
-                    # Some systems might not support children() method
-                    pass
-                
-                return memory_usage
-            except (psutil.NoSuchProcess, psutil.AccessDenied, AttributeError):
-                return None
+                memory_usage += self._get_rss(child)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
         
-        return None
+        return memory_usage
     
-    def _get_cpu_usage(self):
-        """Get CPU usage percentage of the server process."""
-        if self.server_pid:
+    def _prime_cpu_usage(self):
+        """Start a CPU measurement window on the server and its children."""
+        for process in [self._proc] + self._children:
             try:
-                # Get process and all children
-                process = psutil.Process(self.server_pid)
-                
-                # Get CPU percentage
-                try:
-                    cpu_percent = process.cpu_percent(interval=0.1)
-                except (AttributeError, TypeError):
-                    return None
-                
-                # Add children's CPU usage
-                try:
-                    for child in process.children(recursive=True):
-                        try:
-                            child_cpu = child.cpu_percent(interval=0.1)
-                            cpu_percent += child_cpu
-                        except (psutil.NoSuchProcess, psutil.AccessDenied, AttributeError):
-                            continue
-                except (psutil.NoSuchProcess, psutil.AccessDenied, AttributeError):
-                    # Some systems might not support children() method
-                    pass
-                
-                return cpu_percent
+                process.cpu_percent(interval=None)
             except (psutil.NoSuchProcess, psutil.AccessDenied, AttributeError):
-                return None
+                continue
+    
+    def _get_cpu_usage(self, interval=0.1):
+        """
+        Get CPU usage percentage of the server process.
         
-        return None
+        The server and its current children share a single sampling window,
+        opened here, so the call blocks for `interval` seconds regardless of
+        the number of children.
+        """
+        if self._proc is None:
+            return None
+        
+        self._refresh_children()
+        self._prime_cpu_usage()
+        time.sleep(interval)
+        
+        try:
+            cpu_percent = self._proc.cpu_percent(interval=None)
+        except (psutil.NoSuchProcess, psutil.AccessDenied, AttributeError, TypeError):
+            return None
+        
+        # Add children's CPU usage
+        for child in self._children:
+            try:
+                cpu_percent += child.cpu_percent(interval=None)
+            except (psutil.NoSuchProcess, psutil.AccessDenied, AttributeError):
+                continue
+        
+        return cpu_percent
     
     def _send_request(self, index=0):
         """
@@ -141,23 +213,211 @@ class PerformanceTests(TestCase):
             tuple: (status_code, response_time, response_size, error_message)
         """
         # Add a unique query parameter to prevent caching
-        url = f"{self.test_path}?req={index}&random={random.randint(1000, 9999)}"
+        url = self._url_prefix + str(index)
         
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         error_msg = None
         status_code = 0
         response_size = 0
         
         try:
-            response = self.runner.send_request('GET', url, timeout=self.request_timeout)
-            status_code = response.status_code
-            response_size = len(response.content)
+            with self.session.get(url, timeout=self.request_timeout, stream=True) as response:
+                status_code = response.status_code
+                # Drain the body without joining it into one bytes object; a fully
+                # consumed response hands its socket back to the pool on close
+                response_size = sum(len(chunk) for chunk in response.iter_content(8192))
         except requests.exceptions.RequestException as e:
             error_msg = str(e)
         
-        response_time = time.time() - start_time
+        response_time = (time.perf_counter_ns() - start_time) / 1e9
         return (status_code, response_time, response_size, error_msg)
     
+    async def _fetch_async(self, url):
+        """
+        Fetch a URL over a dedicated asyncio connection.
+        
+        Like requests' (connect, read) timeout, request_timeout bounds the
+        connect and each read separately rather than the whole exchange.
+        
+        Args:
+            url (str): Request path including query string
+            
+        Returns:
+            tuple: (status_code, response_size)
+        """
+        timeout = self.request_timeout
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(self.runner.host, self.runner.port), timeout)
+        try:
+            writer.write(f"GET {url} HTTP/1.1\r\n"
+                         f"Host: {self.runner.host}:{self.runner.port}\r\n"
+                         f"Connection: close\r\n\r\n".encode())
+            await writer.drain()
+            
+            # Parse status line and headers
+            head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), timeout)
+            status_line, _, header_block = head.decode('latin-1').partition('\r\n')
+            status_code = int(status_line.split(' ', 2)[1])
+            content_length = None
+            for line in header_block.split('\r\n'):
+                name, _, value = line.partition(':')
+                if name.strip().lower() == 'content-length':
+                    content_length = int(value.strip())
+            
+            # Read the body by length if known, otherwise until the server closes
+            if content_length is not None:
+                body = await asyncio.wait_for(reader.readexactly(content_length), timeout)
+            else:
+                body = await asyncio.wait_for(reader.read(), timeout)
+            return status_code, len(body)
+        finally:
+            writer.close()
+    
+    async def _send_request_async(self, index=0):
+        """
+        Send a single request to the server without blocking a thread.
+        
+        Args:
+            index (int): Request index for generating unique parameters
+            
+        Returns:
+            tuple: (status_code, response_time, response_size, error_message)
+        """
+        # Add a unique query parameter to prevent caching
+        url = self._path_prefix + str(index)
+        
+        start_time = time.perf_counter_ns()
+        error_msg = None
+        status_code = 0
+        response_size = 0
+        
+        try:
+            status_code, response_size = await self._fetch_async(url)
+        except (OSError, ValueError, IndexError, asyncio.TimeoutError,
+                asyncio.IncompleteReadError, asyncio.LimitOverrunError) as e:
+            error_msg = str(e) or e.__class__.__name__
+        
+        response_time = (time.perf_counter_ns() - start_time) / 1e9
+        return (status_code, response_time, response_size, error_msg)
+    
+    async def _send_concurrent_async(self, count):
+        """
+        Send requests over `count` simultaneous connections from a single event loop.
+        
+        Args:
+            count (int): Number of concurrent requests
+            
+        Returns:
+            list: Result tuples as returned by _send_request_async
+        """
+        return await asyncio.gather(*(self._send_request_async(i) for i in range(count)))
+    
+    def _send_pipelined_requests(self, count):
+        """
+        Send requests back-to-back on one connection without waiting for responses.
+        
+        HTTP/1.1 pipelining writes every request up front, then reads the
+        responses in order, so only one round trip is paid for the whole batch.
+        
+        Args:
+            count (int): Number of requests to pipeline
+            
+        Returns:
+            list: Result tuples (status_code, response_time, response_size, error_message),
+                  where response_time is measured from the start of the batch
+        """
+        host = f"{self.runner.host}:{self.runner.port}"
+        payload = b''.join(
+            f"GET {self._path_prefix}{i} HTTP/1.1\r\nHost: {host}\r\n"
+            f"{'Connection: close' if i == count - 1 else 'Connection: keep-alive'}\r\n\r\n".encode()
+            for i in range(count))
+        
+        results = []
+        start_time = time.perf_counter_ns()
+        try:
+            with socket.create_connection((self.runner.host, self.runner.port),
+                                          timeout=self.runner.timeout) as sock:
+                sock.sendall(payload)
+                with sock.makefile('rb') as reader:
+                    for _ in range(count):
+                        status_code, _, response_size = read_response(reader)
+                        results.append((status_code, (time.perf_counter_ns() - start_time) / 1e9, response_size, None))
+        except (OSError, ValueError, IndexError, http.client.HTTPException) as e:
+            # Every request without a response counts as failed
+            error_msg = str(e) or e.__class__.__name__
+            elapsed = (time.perf_counter_ns() - start_time) / 1e9
+            results.extend((0, elapsed, 0, error_msg) for _ in range(count - len(results)))
+        
+        return results
+    
+    def _wait_until_responsive(self, max_wait=1.0, poll_interval=0.01):
+        """
+        Wait until the server answers a probe request successfully.
+        
+        Args:
+            max_wait (float): Maximum time to wait in seconds
+            poll_interval (float): Delay between failed probes in seconds
+            
+        Returns:
+            bool: True if the server responded before the deadline, False otherwise
+        """
+        deadline = time.monotonic() + max_wait
+        while time.monotonic() < deadline:
+            status_code, _, _, error_msg = self._send_request(-1)
+            if status_code == 200 and error_msg is None:
+                return True
+            time.sleep(poll_interval)
+        
+        return False
+    
+    def _successful_response_times(self, results):
+        """
+        Collect the response times of successful (200) requests in a single pass.
+        
+        Args:
+            results (iterable): Result tuples as returned by _send_request
+            
+        Returns:
+            list: Response times of successful requests
+        """
+        response_times = []
+        append = response_times.append
+        for status_code, response_time, _size, _error in results:
+            if status_code == 200:
+                append(response_time)
+        return response_times
+    
+    def _summarize_response_times(self, response_times):
+        """
+        Compute mean, sample standard deviation, min and max in a single pass.
+        
+        Uses Welford's online algorithm, which stays numerically stable without
+        a separate traversal for the mean.
+        
+        Args:
+            response_times (iterable): Response times in seconds
+            
+        Returns:
+            tuple: (mean, stdev, min, max), all 0 for an empty input
+        """
+        count, mean, m2 = 0, 0.0, 0.0
+        low, high = float('inf'), 0.0
+        for response_time in response_times:
+            count += 1
+            delta = response_time - mean
+            mean += delta / count
+            m2 += delta * (response_time - mean)
+            if response_time < low:
+                low = response_time
+            if response_time > high:
+                high = response_time
+        
+        if count == 0:
+            return 0.0, 0.0, 0.0, 0.0
+        
+        stdev = (m2 / (count - 1)) ** 0.5 if count > 1 else 0.0
+        return mean, stdev, low, high
+    
     def test_concurrent_connections(self):
         """
         Test server handling of multiple concurrent connections.
@@ -166,29 +426,23 @@ class PerformanceTests(TestCase):
         without errors, excessive delays, or connection failures.
         """
         try:
-            # Use a ThreadPoolExecutor to manage concurrent requests
-            with ThreadPoolExecutor(max_workers=self.num_concurrent) as executor:
-                # Submit concurrent requests
-                futures = [executor.submit(self._send_request, i) for i in range(self.num_concurrent)]
-                
-                # Collect results
-                results = [future.result() for future in futures]
+            # Open all connections at once from one event loop instead of one thread per request
+            results = asyncio.run(self._send_concurrent_async(self.num_concurrent))
             
             # Analyze results
-            successful = [r for r in results if r[0] == 200]
-            failure_count = len(results) - len(successful)
+            response_times = self._successful_response_times(results)
+            success_count = len(response_times)
             
             # There must be at least 85% successful requests to pass
-            success_rate = len(successful) / len(results) if results else 0
+            success_rate = success_count / len(results) if results else 0
             
             # Check minimum success threshold
             self.assert_true(success_rate >= 0.85, 
                           f"Too many concurrent request failures: success rate {success_rate*100:.1f}% (minimum required: 85%)")
             
             # Only calculate statistics if we have enough successful responses
-            if len(successful) >= self.num_concurrent / 2:
-                response_times = [r[1] for r in successful]
-                avg_response_time = statistics.mean(response_times)
+            if success_count >= self.num_concurrent / 2:
+                avg_response_time = statistics.fmean(response_times)
                 max_response_time = max(response_times)
                 
                 # Calculate dynamic thresholds based on concurrency level
@@ -211,7 +465,7 @@ class PerformanceTests(TestCase):
                 
                 # Log performance data
                 self.logger.debug(f"Concurrent connections: {self.num_concurrent}")
-                self.logger.debug(f"Successful responses: {len(successful)}/{len(results)}")
+                self.logger.debug(f"Successful responses: {success_count}/{len(results)}")
                 self.logger.debug(f"Average response time: {avg_response_time:.4f} seconds")
                 self.logger.debug(f"Maximum response time: {max_response_time:.4f} seconds")
                 self.logger.debug(f"Dynamic avg threshold: {avg_threshold:.4f} seconds")
@@ -226,7 +480,7 @@ class PerformanceTests(TestCase):
                               f"Maximum response time too high: {max_response_time:.4f} seconds (maximum allowed: {max_threshold:.4f}s for {self.num_concurrent} concurrent connections)")
             else:
                 # Not enough successful responses for meaningful analysis
-                self.assert_true(False, f"Not enough successful concurrent requests for performance analysis: {len(successful)}/{self.num_concurrent}")
+                self.assert_true(False, f"Not enough successful concurrent requests for performance analysis: {success_count}/{self.num_concurrent}")
                 
         except Exception as e:
             self.logger.debug(f"Error during concurrent connections test: {e}")
@@ -240,37 +494,40 @@ class PerformanceTests(TestCase):
         without degrading performance or experiencing errors.
         """
         try:
-            # Send many sequential requests as fast as possible
-            results = []
-            start_time = time.time()
+            # Send many sequential requests as fast as possible, recording results in
+            # preallocated parallel arrays instead of keeping one tuple per request
+            num_requests = self.num_requests
+            status_codes = array('i', [0]) * num_requests
+            request_times = array('d', [0.0]) * num_requests
+            start_time = time.perf_counter_ns()
             
-            for i in range(self.num_requests):
-                results.append(self._send_request(i))
+            for i in range(num_requests):
+                status_codes[i], request_times[i], _, _ = self._send_request(i)
             
-            total_time = time.time() - start_time
+            total_time = (time.perf_counter_ns() - start_time) / 1e9
             
             # Analyze results
-            successful = [r for r in results if r[0] == 200]
-            failure_count = len(results) - len(successful)
+            response_times = [response_time for status_code, response_time
+                              in zip(status_codes, request_times) if status_code == 200]
+            success_count = len(response_times)
             
             # We need at least 30% successful requests for this test to be meaningful
             min_required = max(3, int(self.num_requests * 0.3))
             
-            if len(successful) < min_required:
-                self.assert_true(False, f"Too few successful rapid requests: {len(successful)}/{self.num_requests} (minimum {min_required} required)")
+            if success_count < min_required:
+                self.assert_true(False, f"Too few successful rapid requests: {success_count}/{self.num_requests} (minimum {min_required} required)")
                 return
                 
             # Calculate response time statistics
-            response_times = [r[1] for r in successful]
-            avg_response_time = statistics.mean(response_times)
+            avg_response_time = statistics.fmean(response_times)
             max_response_time = max(response_times)
-            requests_per_second = len(results) / total_time if total_time > 0 else 0
+            requests_per_second = num_requests / total_time if total_time > 0 else 0
             
             # Log performance data
-            self.logger.debug(f"Total requests: {len(results)}")
+            self.logger.debug(f"Total requests: {num_requests}")
             self.logger.debug(f"Total time: {total_time:.2f} seconds")
             self.logger.debug(f"Requests per second: {requests_per_second:.2f}")
-            self.logger.debug(f"Successful responses: {len(successful)}/{len(results)}")
+            self.logger.debug(f"Successful responses: {success_count}/{num_requests}")
             self.logger.debug(f"Average response time: {avg_response_time:.4f} seconds")
             self.logger.debug(f"Maximum response time: {max_response_time:.4f} seconds")
             
@@ -279,7 +536,7 @@ class PerformanceTests(TestCase):
                          f"Request throughput too low: {requests_per_second:.2f} req/s (minimum required: 50 req/s)")
             
             # Assert that most requests were successful (at least 85%)
-            success_rate = len(successful) / len(results)
+            success_rate = success_count / num_requests
             self.assert_true(success_rate >= 0.85, 
                          f"Too many rapid request failures: success rate {success_rate*100:.1f}% (minimum required: 85%)")
                           
@@ -287,6 +544,43 @@ class PerformanceTests(TestCase):
             self.logger.debug(f"Error during rapid requests test: {e}")
             self.assert_true(False, f"Rapid requests test failed: {e}")
     
+    def test_pipelined_requests(self):
+        """
+        Test server handling of pipelined requests.
+        
+        Sends a batch of requests back-to-back on a single keep-alive connection
+        and verifies that every response comes back, in order, at a reasonable rate.
+        
+        RFC 7230, Section 6.3.2 - Pipelining
+        """
+        num_requests = self.num_requests
+        start_time = time.perf_counter_ns()
+        results = self._send_pipelined_requests(num_requests)
+        total_time = (time.perf_counter_ns() - start_time) / 1e9
+        
+        response_times = self._successful_response_times(results)
+        success_count = len(response_times)
+        requests_per_second = num_requests / total_time if total_time > 0 else 0
+        
+        # Log performance data
+        self.logger.debug(f"Pipelined requests: {num_requests}")
+        self.logger.debug(f"Total time: {total_time:.2f} seconds")
+        self.logger.debug(f"Requests per second: {requests_per_second:.2f}")
+        self.logger.debug(f"Successful responses: {success_count}/{num_requests}")
+        
+        first_error = next((error for _, _, _, error in results if error), None)
+        if first_error:
+            self.logger.debug(f"First pipelining error: {first_error}")
+        
+        # Assert that most pipelined requests were answered successfully (at least 85%)
+        success_rate = success_count / num_requests
+        self.assert_true(success_rate >= 0.85, 
+                     f"Too many pipelined request failures: success rate {success_rate*100:.1f}% (minimum required: 85%)")
+        
+        # Assert minimum performance - same floor as sequential rapid requests
+        self.assert_true(requests_per_second >= 50.0, 
+                     f"Pipelined throughput too low: {requests_per_second:.2f} req/s (minimum required: 50 req/s)")
+    
     def test_memory_usage_under_load(self):
         """
         Test server memory usage under load conditions.
@@ -316,36 +610,34 @@ class PerformanceTests(TestCase):
         requests_per_batch = 30
         memory_samples = [baseline_memory]
         
-        for batch in range(test_batches):
-            self.logger.debug(f"Running request batch {batch+1}/{test_batches}")
-            
-            # Send concurrent requests in this batch
-            with ThreadPoolExecutor(max_workers=10) as executor:
+        # One pool for all batches so worker threads are reused
+        with ThreadPoolExecutor(max_workers=min(10, self.max_workers)) as executor:
+            for batch in range(test_batches):
+                self.logger.debug(f"Running request batch {batch+1}/{test_batches}")
+                
+                # Send concurrent requests in this batch
                 futures = [executor.submit(self._send_request, i) 
                           for i in range(requests_per_batch)]
                 
-                # Wait for all requests to complete
-                results = [future.result() for future in futures]
-                
-                # Check if requests were successful
-                successful = [r for r in results if r[0] == 200]
-                success_rate = len(successful) / len(results) if results else 0
+                # Wait for all requests to complete, counting successes as they finish
+                success_count = sum(1 for future in as_completed(futures) if future.result()[0] == 200)
+                success_rate = success_count / len(futures) if futures else 0
                 self.logger.debug(f"Batch {batch+1} success rate: {success_rate*100:.1f}%")
                 
                 # If no successful requests, fail the test
-                if not successful:
+                if not success_count:
                     self.assert_true(False, f"No successful requests in batch {batch+1} - cannot continue memory test")
                     return
-            
-            # Capture memory after batch
-            current_memory = self._get_memory_usage()
-            if current_memory is None:
-                self.assert_true(False, f"Lost ability to monitor memory during test - cannot continue memory test")
-                return
                 
-            memory_samples.append(current_memory)
-            current_memory_mb = current_memory / (1024 * 1024)
-            self.logger.debug(f"Memory after batch {batch+1}: {current_memory_mb:.2f} MB")
+                # Capture memory after batch
+                current_memory = self._get_memory_usage()
+                if current_memory is None:
+                    self.assert_true(False, f"Lost ability to monitor memory during test - cannot continue memory test")
+                    return
+                    
+                memory_samples.append(current_memory)
+                current_memory_mb = current_memory / (1024 * 1024)
+                self.logger.debug(f"Memory after batch {batch+1}: {current_memory_mb:.2f} MB")
         
         # Check for excessive memory growth - we need at least 3 samples for a meaningful test
         if len(memory_samples) < 3:
@@ -392,17 +684,17 @@ class PerformanceTests(TestCase):
                 self.logger.debug(f"Sending connection burst {burst+1}/{bursts}")
                 
                 # Send a burst of concurrent connections
-                with ThreadPoolExecutor(max_workers=self.burst_size) as executor:
+                with ThreadPoolExecutor(max_workers=min(self.burst_size, self.max_workers)) as executor:
                     # Submit concurrent requests for this burst
                     futures = [executor.submit(self._send_request, i + (burst * self.burst_size)) 
                               for i in range(self.burst_size)]
                     
-                    # Collect results for this burst
-                    burst_results = [future.result() for future in futures]
+                    # Collect results for this burst as they finish
+                    burst_results = [future.result() for future in as_completed(futures)]
                     results_by_burst.append(burst_results)
                 
-                # Brief pause between bursts to let the server recover
-                time.sleep(1)
+                # Let the server recover, but only as long as it actually needs
+                self._wait_until_responsive()
         
             # Analyze results - all bursts must have some level of success
             successful_by_burst = []
@@ -410,19 +702,19 @@ class PerformanceTests(TestCase):
             min_success_count = max(1, int(self.burst_size * 0.3))  # At least 30% should succeed
             
             for i, burst_results in enumerate(results_by_burst):
-                successful = [r for r in burst_results if r[0] == 200]
-                successful_by_burst.append(len(successful))
+                response_times = self._successful_response_times(burst_results)
+                success_count = len(response_times)
+                successful_by_burst.append(success_count)
                 
                 # Each burst must have at least some successful requests
-                if len(successful) < min_success_count:
+                if success_count < min_success_count:
                     self.assert_true(False, 
-                                  f"Burst {i+1} had too few successful requests: {len(successful)}/{self.burst_size}")
+                                  f"Burst {i+1} had too few successful requests: {success_count}/{self.burst_size}")
                     return
                 
                 # Calculate average response time for successful requests
-                response_times = [r[1] for r in successful]
                 if response_times:
-                    avg_time = statistics.mean(response_times)
+                    avg_time = statistics.fmean(response_times)
                     avg_response_times.append(avg_time)
                 else:
                     # We shouldn't reach here due to the check above, but just in case
@@ -492,13 +784,9 @@ class PerformanceTests(TestCase):
                 return
             
             # Analyze response time consistency
-            avg_time = statistics.mean(response_times)
+            avg_time, stdev, min_time, max_time = self._summarize_response_times(response_times)
             median_time = statistics.median(response_times)
-            min_time = min(response_times)
-            max_time = max(response_times)
             
-            # Calculate standard deviation to measure consistency
-            stdev = statistics.stdev(response_times) if len(response_times) > 1 else 0
             # Coefficient of variation (relative standard deviation)
             cv = (stdev / avg_time) * 100 if avg_time > 0 else 0
             
@@ -12,81 +12,273 @@ Tests for file upload functionality according to test.conf configuration:
 Verifies correct handling of single and multiple file uploads, size limits, and error cases.
 """
 
+import io
+import itertools
 import requests
 import os
 import tempfile
 import shutil
-import time
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from core.test_case import TestCase
 from core.path_utils import resolve_path
 
-class UploadTests(TestCase):
-    """Tests file upload functionality based on test.conf configuration."""
+# Timeouts for the large body-size upload: the first attempt, and the single
+# retry given to a server that is merely slow to take in 4MB
+LARGE_UPLOAD_TIMEOUT = 5
+LARGE_UPLOAD_RETRY_TIMEOUT = 30
+
+# Worker threads for removing leftover uploads
+CLEANUP_WORKERS = 8
+
+# RAM-backed parent for the fixture directory where available; None means the default temp dir
+FIXTURE_ROOT = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+# Small and medium upload contents, sent straight from memory; requests
+# takes bytes as file content, so no file is opened or re-read per test
+SMALL_PAYLOAD = b"Small test file for upload"
+MEDIUM_PAYLOAD = b"A" * 10000  # 10KB file
+
+# Body-size payload sizes; the files are written in setup_suite, a block at a
+# time, so uploads stream from disk and nothing this large is built at import
+PAYLOAD_BELOW_LIMIT_SIZE = 4 * 1024 * 1024  # 4MB, below the main server's 5MB limit
+PAYLOAD_ABOVE_LIMIT_SIZE = 60 * 1024        # 60KB, above /small_limit's 50KB limit
+
+# Block of filler bytes the body-size files are written from
+FILL_BLOCK = b'X' * (64 * 1024)
+
+def _write_filled(path, size):
+    """
+    Write a file of the given size filled with FILL_BLOCK bytes.
     
-    def setup(self):
-        """Set up temporary directory for uploads."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_files = []
+    Args:
+        path (str): Path of the file to create
+        size (int): File size in bytes
+    """
+    block_size = len(FILL_BLOCK)
+    with open(path, "wb") as f:
+        for _ in range(size // block_size):
+            f.write(FILL_BLOCK)
+        f.write(FILL_BLOCK[:size % block_size])
+
+class _MultipartFileBody:
+    """
+    Single-file multipart/form-data body streamed from an open file.
+    
+    requests sends objects with read() and a length as a Content-Length body,
+    reading them in blocks, so the file is never loaded into memory whole.
+    tell() and seek() let requests rewind the body if it has to resend it.
+    """
+    
+    def __init__(self, field, filename, fileobj, content_type):
+        """
+        Build the multipart framing around a file.
         
-        # Create test files of different sizes
-        self.small_file_path = os.path.join(self.temp_dir, "small.txt")
-        with open(self.small_file_path, "w") as f:
-            f.write("Small test file for upload")
+        Args:
+            field (str): Form field name
+            filename (str): Filename reported to the server
+            fileobj (io.BufferedReader): Open binary file, read from its current position
+            content_type (str): Content type of the file part
+        """
+        boundary = os.urandom(16).hex()
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        head = (f'--{boundary}\r\n'
+                f'Content-Disposition: form-data; name="{field}"; filename="{filename}"\r\n'
+                f'Content-Type: {content_type}\r\n\r\n').encode()
+        tail = f'\r\n--{boundary}--\r\n'.encode()
+        self._file = fileobj
+        self._file_start = fileobj.tell()
+        self._file_size = os.fstat(fileobj.fileno()).st_size - self._file_start
+        self._head = io.BytesIO(head)
+        self._tail = io.BytesIO(tail)
+        self._length = len(head) + self._file_size + len(tail)
+        self._position = 0
+        self._parts = [self._head, self._file, self._tail]
+    
+    def __len__(self):
+        return self._length
+    
+    def __iter__(self):
+        return iter(lambda: self.read(8192), b'')
+    
+    def tell(self):
+        """
+        Get the current offset into the body.
         
-        self.medium_file_path = os.path.join(self.temp_dir, "medium.txt")
-        with open(self.medium_file_path, "w") as f:
-            f.write("A" * 10000)  # 10KB file
+        Returns:
+            int: Number of body bytes read so far
+        """
+        return self._position
+    
+    def seek(self, offset, whence=io.SEEK_SET):
+        """
+        Move to an absolute offset in the body.
         
-        self.test_files.extend([self.small_file_path, self.medium_file_path])
+        Args:
+            offset (int): Offset from the start of the body
+            whence (int): Only io.SEEK_SET is supported
+            
+        Returns:
+            int: The new offset
+        """
+        if whence != io.SEEK_SET:
+            raise io.UnsupportedOperation("only absolute seeks are supported")
+        head_size = len(self._head.getbuffer())
+        self._head.seek(min(offset, head_size))
+        self._file.seek(self._file_start + min(max(offset - head_size, 0), self._file_size))
+        self._tail.seek(max(offset - head_size - self._file_size, 0))
+        self._parts = [self._head, self._file, self._tail]
+        self._position = offset
+        return offset
+    
+    def read(self, size=-1):
+        """
+        Read up to size bytes of the body, crossing part boundaries as needed.
         
+        Args:
+            size (int): Maximum number of bytes to read; negative reads everything
+            
+        Returns:
+            bytes: Next chunk of the body, empty once it is exhausted
+        """
+        chunks = []
+        remaining = size
+        while self._parts and remaining != 0:
+            chunk = self._parts[0].read(remaining)
+            if not chunk:
+                self._parts.pop(0)
+                continue
+            chunks.append(chunk)
+            if remaining > 0:
+                remaining -= len(chunk)
+        data = b''.join(chunks)
+        self._position += len(data)
+        return data
+
+class UploadTests(TestCase):
+    """Tests file upload functionality based on test.conf configuration."""
+    
+    def setup_suite(self):
+        """Set up the connection state and fixture files shared by all upload tests."""
         # From test.conf configuration, we know the upload endpoint
         self.upload_endpoint = '/upload'
         
-        # Clean up upload directory before testing
-        self._clean_uploads_directory()
+        # Other suites may have left uploads behind, so the first setup cleans
+        self._uploads_dirty = True
+        
+        # Full URLs of the body-size test's upload targets
+        self._main_upload_url = f"{self.runner.base_url}{self.upload_endpoint}"
+        self._small_limit_url = f"http://{self.runner.host}:8082/small_limit"
+        
+        # One keep-alive session for the whole suite so each upload reuses a
+        # pooled connection instead of reconnecting
+        self.open_session(pool_maxsize=8, pool_connections=4)
+        
+        # Tests only read the fixture files, so they are written once per suite
+        self.fixture_dir = tempfile.mkdtemp(dir=FIXTURE_ROOT)
+        
+        # Body-size test files, uploaded straight from disk
+        self.large_file_path = os.path.join(self.fixture_dir, "large_4MB.bin")
+        _write_filled(self.large_file_path, PAYLOAD_BELOW_LIMIT_SIZE)
+        
+        self.above_limit_file_path = os.path.join(self.fixture_dir, "above_limit_60KB.bin")
+        _write_filled(self.above_limit_file_path, PAYLOAD_ABOVE_LIMIT_SIZE)
+    
+    def teardown_suite(self):
+        """Close the shared session and remove the fixture files."""
+        self.session.close()
+        shutil.rmtree(self.fixture_dir, ignore_errors=True)
+    
+    def setup(self):
+        """Set up temporary directory for uploads."""
+        # Per-test scratch space for files a single test creates, under the fixture dir
+        self.temp_dir = tempfile.mkdtemp(dir=self.fixture_dir)
+        self.test_files = []
+        
+        # Clean up upload directory before testing, unless the previous test's
+        # teardown already left it clean
+        if self._uploads_dirty:
+            self._clean_uploads_directory()
+            self._uploads_dirty = False
     
     def teardown(self):
         """Clean up temporary files and directories."""
+        # The test registered every file it made, so unlink those and remove the
+        # then-empty directory without a recursive walk
         for file_path in self.test_files:
-            if os.path.exists(file_path):
-                try:
-                    os.remove(file_path)
-                except:
-                    pass
+            try:
+                os.unlink(file_path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                self.logger.debug(f"Error removing test file {file_path}: {e}")
         
-        if hasattr(self, 'temp_dir') and os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+        if hasattr(self, 'temp_dir'):
+            try:
+                os.rmdir(self.temp_dir)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                # Something unregistered was left behind
+                shutil.rmtree(self.temp_dir, ignore_errors=True)
         
-        # Clean up upload directory after testing
+        # Clean up upload directory after testing; if this raises, the next
+        # setup cleans again
+        self._uploads_dirty = True
         self._clean_uploads_directory()
+        self._uploads_dirty = False
     
     def _clean_uploads_directory(self):
         """Remove all files from the uploads directory."""
         uploads_dir = resolve_path('data/uploads')
         errors = []
         if os.path.exists(uploads_dir):
-            self.logger.debug(f"Cleaning uploads directory: {uploads_dir}")
-            for item in os.listdir(uploads_dir):
-                item_path = os.path.join(uploads_dir, item)
-                if os.path.isfile(item_path):
-                    try:
-                        os.remove(item_path)
-                        self.logger.debug(f"Removed file: {item_path}")
-                    except Exception as e:
-                        self.logger.debug(f"Error removing file {item_path}: {e}")
-                        errors.append(f"File: {item_path} - {e}")
-                elif os.path.isdir(item_path):
+            # DirEntry carries the file type from the directory read, so no extra stat per item
+            with os.scandir(uploads_dir) as entries:
+                first = next(entries, None)
+                if first is None:
+                    # Already clean, which is the usual case
+                    return
+                items = [(entry.path, entry.is_dir(follow_symlinks=False))
+                         for entry in itertools.chain((first,), entries)]
+            
+            # Removals are independent and block on the filesystem, so overlap them
+            with ThreadPoolExecutor(max_workers=CLEANUP_WORKERS) as executor:
+                futures = {executor.submit(shutil.rmtree if is_dir else os.remove, item_path): (item_path, is_dir)
+                           for item_path, is_dir in items}
+                for future in as_completed(futures):
                     try:
-                        shutil.rmtree(item_path)
-                        self.logger.debug(f"Removed directory: {item_path}")
+                        future.result()
                     except Exception as e:
-                        self.logger.debug(f"Error removing directory {item_path}: {e}")
-                        errors.append(f"Directory: {item_path} - {e}")
+                        item_path, is_dir = futures[future]
+                        kind = "directory" if is_dir else "file"
+                        self.logger.debug(f"Error removing {kind} {item_path}: {e}")
+                        errors.append(f"{kind.capitalize()}: {item_path} - {e}")
+            
+            # The log file always records DEBUG, so successes get one summary line
+            # rather than a formatted record per removed item
+            self.logger.debug(f"Cleaned uploads directory {uploads_dir}: removed {len(items) - len(errors)} of {len(items)} items")
         if errors:
             self.logger.error(f"Upload directory cleanup encountered errors: {errors}")
             raise RuntimeError(f"Upload directory cleanup failed for some items: {errors}")
     
+    def _post_file(self, url, file_path, filename, timeout):
+        """
+        Upload one file as multipart/form-data, streaming it from disk.
+        
+        Args:
+            url (str): Full upload URL
+            file_path (str): Path of the file to upload
+            filename (str): Filename reported to the server
+            timeout (float): Request timeout in seconds
+            
+        Returns:
+            requests.Response: HTTP response object
+        """
+        with open(file_path, 'rb') as f:
+            body = _MultipartFileBody('file', filename, f, 'text/plain')
+            return self.session.post(url, data=body, headers={'Content-Type': body.content_type},
+                                     timeout=timeout)
+    
     def test_upload_single_file(self):
         """
         Test basic single file upload to the /upload endpoint.
@@ -99,16 +291,15 @@ class UploadTests(TestCase):
         }
         """
         try:
-            # Open the small test file
-            with open(self.small_file_path, "rb") as f:
-                files = {"file": ("test.txt", f, "text/plain")}
-                
-                # Send upload request to the configured upload endpoint
-                response = self.runner.send_request('POST', self.upload_endpoint, files=files)
-                
-                # Check response - should be 200-299 for success
-                self.assert_true(200 <= response.status_code < 300, 
-                                f"Upload failed with status code {response.status_code}")
+            # The small test file, straight from memory
+            files = {"file": ("test.txt", SMALL_PAYLOAD, "text/plain")}
+            
+            # Send upload request to the configured upload endpoint
+            response = self._request('POST', self.upload_endpoint, files=files)
+            
+            # Check response - should be 200-299 for success
+            self.assert_true(200 <= response.status_code < 300, 
+                            f"Upload failed with status code {response.status_code}")
         except requests.RequestException as e:
             self.assert_true(False, f"Upload request failed: {e}")
     
@@ -125,18 +316,17 @@ class UploadTests(TestCase):
         """
         try:
             # Prepare multiple files
-            with open(self.small_file_path, "rb") as f1, open(self.medium_file_path, "rb") as f2:
-                files = {
-                    "file1": ("test1.txt", f1, "text/plain"),
-                    "file2": ("test2.txt", f2, "text/plain")
-                }
-                
-                # Send upload request to the configured upload endpoint
-                response = self.runner.send_request('POST', self.upload_endpoint, files=files)
-                
-                # Check response - should be 200-299 for success
-                self.assert_true(200 <= response.status_code < 300, 
-                                f"Multiple file upload failed with status code {response.status_code}")
+            files = {
+                "file1": ("test1.txt", SMALL_PAYLOAD, "text/plain"),
+                "file2": ("test2.txt", MEDIUM_PAYLOAD, "text/plain")
+            }
+            
+            # Send upload request to the configured upload endpoint
+            response = self._request('POST', self.upload_endpoint, files=files)
+            
+            # Check response - should be 200-299 for success
+            self.assert_true(200 <= response.status_code < 300, 
+                            f"Multiple file upload failed with status code {response.status_code}")
         except requests.RequestException as e:
             self.assert_true(False, f"Multiple file upload request failed: {e}")
     
@@ -153,16 +343,15 @@ class UploadTests(TestCase):
         """
         try:
             # Prepare file and additional fields
-            with open(self.small_file_path, "rb") as f:
-                files = {"file": ("test.txt", f, "text/plain")}
-                data = {"field1": "value1", "field2": "value2"}
-                
-                # Send upload request to the configured upload endpoint
-                response = self.runner.send_request('POST', self.upload_endpoint, files=files, data=data)
-                
-                # Check response - should be 200-299 for success
-                self.assert_true(200 <= response.status_code < 300, 
-                                f"Upload with fields failed with status code {response.status_code}")
+            files = {"file": ("test.txt", SMALL_PAYLOAD, "text/plain")}
+            data = {"field1": "value1", "field2": "value2"}
+            
+            # Send upload request to the configured upload endpoint
+            response = self._request('POST', self.upload_endpoint, files=files, data=data)
+            
+            # Check response - should be 200-299 for success
+            self.assert_true(200 <= response.status_code < 300, 
+                            f"Upload with fields failed with status code {response.status_code}")
         except requests.RequestException as e:
             self.assert_true(False, f"Upload with fields request failed: {e}")
     
@@ -190,7 +379,7 @@ class UploadTests(TestCase):
                 files = {"file": ("empty.txt", f, "text/plain")}
                 
                 # Send upload request to the configured upload endpoint
-                response = self.runner.send_request('POST', self.upload_endpoint, files=files)
+                response = self._request('POST', self.upload_endpoint, files=files)
                 
                 # Check response - should be 200-299 for success
                 self.assert_true(200 <= response.status_code < 300, 
@@ -216,20 +405,18 @@ class UploadTests(TestCase):
         disallowed_location = '/static'
         
         try:
-            # Try to upload to a location that doesn't allow POST
-            with open(self.small_file_path, "rb") as f:
-                files = {"file": ("test.txt", f, "text/plain")}
-                
-                response = self.runner.send_request('POST', disallowed_location, files=files)
-                
-                # Should be rejected with 405 Method Not Allowed
-                self.assert_equals(response.status_code, 405, 
-                                f"Upload to {disallowed_location} should be rejected with 405, got {response.status_code}")
-                
-                # Should include Allow header
-                if response.status_code == 405:
-                    self.assert_true('Allow' in response.headers, 
-                                    "405 Method Not Allowed response must include Allow header")
+            # Try to POST to a location that doesn't allow it; the method alone is
+            # rejected, so an empty body (Content-Length: 0) is enough
+            response = self._request('POST', disallowed_location, data=b'')
+            
+            # Should be rejected with 405 Method Not Allowed
+            self.assert_equals(response.status_code, 405, 
+                            f"Upload to {disallowed_location} should be rejected with 405, got {response.status_code}")
+            
+            # Should include Allow header
+            if response.status_code == 405:
+                self.assert_true('Allow' in response.headers, 
+                                "405 Method Not Allowed response must include Allow header")
         except requests.RequestException as e:
             # Connection errors are NOT acceptable - server should return proper HTTP status
             self.assert_true(False, f"Server failed to respond with proper HTTP status for rejected upload to {disallowed_location}: {e}")
@@ -247,7 +434,7 @@ class UploadTests(TestCase):
         """
         try:
             # Send GET request to upload endpoint
-            response = self.runner.send_request('GET', self.upload_endpoint)
+            response = self._request('GET', self.upload_endpoint)
             
             # Should be rejected with 405 Method Not Allowed
             self.assert_equals(response.status_code, 405, 
@@ -272,45 +459,27 @@ class UploadTests(TestCase):
         - Server on port 8082 has client_max_body_size 1m
         - /small_limit on port 8082 has client_max_body_size 50k
         """
-        import io
-        
         # Test case 1: Upload to main server (5MB limit)
-        main_server_url = f"http://{self.runner.host}:{self.runner.port}{self.upload_endpoint}"
-        
-        # Create a 4MB file (below the 5MB limit)
-        size_below_limit = 4 * 1024 * 1024  # 4MB
-        data_below_limit = io.BytesIO(b'X' * size_below_limit)
-        files_below_limit = {'file': ('test_4MB.txt', data_below_limit, 'text/plain')}
-        
         try:
-            # This should succeed (below limit)
-            response = requests.post(main_server_url, files=files_below_limit, timeout=5)
+            # Upload a 4MB file (below the 5MB limit); this should succeed
+            try:
+                response = self._post_file(self._main_upload_url, self.large_file_path, 'test_4MB.txt',
+                                           timeout=LARGE_UPLOAD_TIMEOUT)
+            except requests.Timeout:
+                # Only this upload gets a retry, with a longer timeout, so a slow
+                # server is not failed while no other upload can be stored twice
+                response = self._post_file(self._main_upload_url, self.large_file_path, 'test_4MB.txt',
+                                           timeout=LARGE_UPLOAD_RETRY_TIMEOUT)
             self.assert_true(response.status_code < 400, 
                             f"Upload of 4MB to main server rejected with status {response.status_code}")
         except requests.RequestException as e:
-            if "timed out" in str(e):
-                # Timeout is NOT acceptable - server should handle large uploads properly
-                # Increase timeout and retry once, or fail if server can't handle it
-                try:
-                    response = requests.post(main_server_url, files=files_below_limit, timeout=30)
-                    self.assert_true(response.status_code < 400, 
-                                    f"Upload of 4MB to main server rejected with status {response.status_code}")
-                except requests.RequestException as retry_e:
-                    self.assert_true(False, f"Upload of 4MB failed even with extended timeout: {retry_e}")
-            else:
-                self.assert_true(False, f"Upload of 4MB failed: {e}")
+            # Timeout is NOT acceptable - server should handle large uploads properly
+            self.assert_true(False, f"Upload of 4MB failed: {e}")
         
         # Test case 2: Upload to server on port 8082/small_limit (50KB limit)
-        small_limit_url = f"http://{self.runner.host}:8082/small_limit"
-        
-        # Create a 60KB file (above the 50KB limit)
-        size_above_limit = 60 * 1024  # 60KB
-        data_above_limit = io.BytesIO(b'X' * size_above_limit)
-        files_above_limit = {'file': ('test_60KB.txt', data_above_limit, 'text/plain')}
-        
         try:
-            # This should fail with 413 Payload Too Large
-            response = requests.post(small_limit_url, files=files_above_limit, timeout=2)
+            # Upload a 60KB file (above the 50KB limit); this should fail with 413 Payload Too Large
+            response = self._post_file(self._small_limit_url, self.above_limit_file_path, 'test_60KB.txt', timeout=2)
             self.assert_equals(response.status_code, 413, 
                             f"Upload of 60KB to /small_limit should be rejected with 413, got {response.status_code}")
         except requests.RequestException as e:
@@ -337,7 +506,7 @@ class UploadTests(TestCase):
         try:
             # Send POST request with form data
             headers = {'Content-Type': 'application/x-www-form-urlencoded'}
-            response = self.runner.send_request('POST', upload_path, data=form_data, headers=headers)
+            response = self._request('POST', upload_path, data=form_data, headers=headers)
             
             # First, check that POST method is accepted (not 405)
             self.assert_true(response.status_code != 405, 
@@ -14,118 +14,368 @@ RFC references:
 """
 
 import os
+import re
+import base64
+import stat
+import sys
 import time
-import random
-import string
+import threading
 import requests
-import urllib.parse
 import shutil
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from requests.utils import requote_uri
 from core.test_case import TestCase
-from core.path_utils import get_tester_root, resolve_path
+from core.path_utils import resolve_path
+
+# Subdirectories of the URI test directory, relative to it
+URI_TEST_DIRS = (
+    os.path.join('a', 'b', 'c'),
+    os.path.join('docs', 'files'),
+    'UPPERCASE',
+    'with spaces',
+    'special+chars',
+)
+
+def _page(heading, paragraph=None):
+    """
+    Render a minimal HTML test page.
+    
+    Args:
+        heading (str): Text of the page's h1
+        paragraph (str, optional): Text of a paragraph after the heading
+        
+    Returns:
+        bytes: UTF-8 encoded HTML document
+    """
+    body = f"<h1>{heading}</h1>" if paragraph is None else f"<h1>{heading}</h1><p>{paragraph}</p>"
+    return f"<!DOCTYPE html>\n<html><body>{body}</body></html>".encode()
+
+# Fixture files as (path relative to the URI test directory, content), rendered once
+URI_TEST_FILES = (
+    # Test file in root directory
+    ('test.html', _page('URI Test File', 'Root directory test file')),
+    
+    # Test files in nested directories
+    (os.path.join('a', 'test.html'), _page('URI Test File', 'Directory A test file')),
+    (os.path.join('a', 'b', 'test.html'), _page('URI Test File', 'Directory A/B test file')),
+    (os.path.join('a', 'b', 'c', 'test.html'), _page('URI Test File', 'Directory A/B/C test file')),
+    
+    # Index files for directory testing
+    ('index.html', _page('Index File', 'Root directory index')),
+    (os.path.join('a', 'index.html'), _page('Index File', 'Directory A index')),
+    
+    # Files with special characters in names
+    (os.path.join('with spaces', 'file with spaces.html'), _page('File With Spaces')),
+    (os.path.join('special+chars', 'file+with+plus.html'), _page('File With Plus Signs')),
+    
+    # File with mixed case name
+    ('MixedCase.html', _page('Mixed Case Filename')),
+    
+    # File in the UPPERCASE directory
+    (os.path.join('UPPERCASE', 'FILE.html'), _page('UPPERCASE FILE')),
+)
+
+# Entries individual tests add to the URI test directory, removed after each test
+URI_TRANSIENT_ENTRIES = ('no_index', 'trailingslash', 'trailingslash.html')
+
+# Where teardown_suite moves the fixture tree before deleting it: beside
+# data/www on the same filesystem, but outside every served root
+GRAVEYARD_DIR = 'data/.gc'
+
+def _write_fixture(path, content):
+    """
+    Write a fixture file in one binary write.
+    
+    Args:
+        path (str): Absolute path of the file
+        content (bytes): File content
+    """
+    with open(path, 'wb') as f:
+        f.write(content)
+
+# Keyword for shutil.rmtree's error callback; onerror is deprecated from 3.12
+RMTREE_ERROR_HANDLER = 'onexc' if sys.version_info >= (3, 12) else 'onerror'
+
+def _chmod_and_retry(func, path, _exc):
+    """
+    shutil.rmtree error callback: make the path accessible and retry once.
+    
+    Args:
+        func (callable): The os function that failed
+        path (str): Path it failed on
+        _exc: Exception (onexc) or exc_info tuple (onerror), unused
+    """
+    os.chmod(path, stat.S_IRWXU)
+    func(path)
+
+# Markers of an autoindex page, lowercased once for case-insensitive matching
+DIR_LISTING_INDICATORS = tuple(indicator.lower() for indicator in (
+    'Index of',
+    'Directory listing',
+    'Parent Directory',
+    '<dir',
+    '<directory',
+    'file0.html',
+    'file1.html',
+    'file2.html',
+))
+
+# Content checks only look this far into a response body; every fixture page
+# is far shorter, and the markers sit near its start
+BODY_CHECK_BYTES = 1024
+
+# Marker of an HTML document, matched against raw body bytes
+HTML_MARKER = b'<html>'
+
+# Translation tables for turning a segment description into a filename, and
+# for percent-encoding the spaces of a filename in a URI
+DESCRIPTION_TO_FILENAME = str.maketrans({' ': '_'})
+ENCODE_SPACES = str.maketrans({' ': '%20'})
+
+# Concurrent requests per URI sweep; also the size of the session's connection pool
+MAX_WORKERS = 16
+
+# Worker threads for writing fixture files
+FIXTURE_WORKERS = 8
+
+# Paragraph text of the nested fixture pages as byte needles, shared by the
+# normalization and path mapping checks
+DIR_A_TEXT = b'Directory A test file'
+DIR_ABC_TEXT = b'Directory A/B/C test file'
+
+# (path, expected content) pairs for test_uri_path_normalization
+NORMALIZATION_CASES = (
+    ('/uri_tests/a/./test.html', DIR_A_TEXT),
+    ('/uri_tests/a/b/../test.html', DIR_A_TEXT),
+    ('/uri_tests/a/b/c/../../test.html', DIR_A_TEXT),
+    ('/uri_tests/a/./b/./c/./test.html', DIR_ABC_TEXT),
+    ('/uri_tests/a//b///c////test.html', DIR_ABC_TEXT),
+    ('/uri_tests/./a/./b/./c/./test.html', DIR_ABC_TEXT),
+    ('/uri_tests/../uri_tests/a/test.html', DIR_A_TEXT),
+)
+
+# Paths that try to escape the document root
+TRAVERSAL_ATTEMPTS = (
+    '/uri_tests/../../../etc/passwd',
+    '/../../../etc/passwd',
+    '/uri_tests/..%2f..%2f..%2fetc/passwd',  # URL-encoded "../"
+    '/uri_tests/%2e%2e/%2e%2e/%2e%2e/etc/passwd',  # URL-encoded "../"
+    '/uri_tests/a/b/c/../../../../etc/passwd',
+    '/%2e%2e/%2e%2e/%2e%2e/etc/passwd',  # URL-encoded "../"
+)
+
+# (path, encoded_path, expected_status_code) for test_uri_encoding_decoding
+ENCODING_CASES = (
+    ('/uri_tests/with spaces/file with spaces.html', 
+     '/uri_tests/with%20spaces/file%20with%20spaces.html', 200),
+    
+    ('/uri_tests/special+chars/file+with+plus.html', 
+     '/uri_tests/special%2Bchars/file%2Bwith%2Bplus.html', 200),
+    
+    # Test some special ASCII characters
+    ('/uri_tests/test.html', '/uri_tests/test%2Ehtml', 200),  # %2E = .
+    
+    # Test encoded slash
+    ('/uri_tests%2Ftest.html', None, 404),  # %2F = / (should be different resource)
+    
+    # Test various encoded characters
+    ('/uri_tests/test%41.html', None, 404),  # %41 = A
+    ('/uri_tests/test%7a.html', None, 404),  # %7a = z
+    
+    # Test a complex encoded path
+    ('/uri_tests/with%20spaces/file%20with%20spaces.html', None, 200),
+)
+
+# Characters that make requests rewrite a request target: percent-escapes (it
+# decodes the unreserved ones) and anything outside RFC 3986's reserved and
+# unreserved sets. Paths without any are sent exactly as written
+REQUOTED_CHARS = re.compile(r"[^A-Za-z0-9\-._~!#$&'()*+,/:;=?@\[\]]")
+
+def _distinct_on_wire(cases):
+    """
+    Drop cases whose path goes out as the same request target as an earlier one.
+    
+    requests percent-encodes characters such as spaces and decodes escapes of
+    unreserved characters before sending, so a raw path and its hand-encoded
+    form can reach the server byte-identical. Paths with nothing to rewrite
+    skip the requoting.
+    
+    Args:
+        cases (iterable): (path, expected_status) pairs
+        
+    Returns:
+        tuple: The first case for each distinct request target, in order
+    """
+    distinct = {}
+    for path, expected_status in cases:
+        target = requote_uri(path) if REQUOTED_CHARS.search(path) else path
+        distinct.setdefault(target, (path, expected_status))
+    return tuple(distinct.values())
+
+# Every original and encoded path of ENCODING_CASES with the status expected for
+# it, flattened once and without repeats of the same request target
+ENCODING_PATHS = _distinct_on_wire(
+    (path, expected_status)
+    for original_path, encoded_path, expected_status in ENCODING_CASES
+    for path in (original_path, encoded_path) if path
+)
+
+# (uri, content_check) for test_uri_path_mapping
+PATH_MAPPING_CASES = (
+    ('/uri_tests/test.html', b'Root directory test file'),
+    ('/uri_tests/a/test.html', DIR_A_TEXT),
+    ('/uri_tests/a/b/test.html', b'Directory A/B test file'),
+    ('/uri_tests/a/b/c/test.html', DIR_ABC_TEXT),
+)
+
+# (uri, content_check) for directory URIs that should resolve to index files
+DEFAULT_DOCUMENT_CASES = (
+    ('/uri_tests/', b'Root directory index'),
+    ('/uri_tests/a/', b'Directory A index'),
+)
+
+# (uri, expected_status) for test_uri_with_multiple_slashes
+MULTIPLE_SLASH_CASES = (
+    ('/uri_tests//test.html', 200),
+    ('/uri_tests///test.html', 200),
+    ('/uri_tests//a///b////c/////test.html', 200),
+)
+
+# (uri, expected_status) for test_uri_case_sensitivity; None accepts either behaviour
+CASE_SENSITIVITY_CASES = (
+    ('/uri_tests/MixedCase.html', 200),  # Original case
+    ('/uri_tests/mixedcase.html', None),  # Lowercase
+    ('/uri_tests/MIXEDCASE.html', None),  # Uppercase
+    ('/uri_tests/UPPERCASE/FILE.html', 200),  # Original case
+    ('/uri_tests/uppercase/file.html', None),  # Lowercase
+)
+
+# (uri_length, expected_status_range) for test_uri_too_long
+LONG_URI_CASES = (
+    (512, range(200, 301)),    # Should be fine
+    (1024, range(200, 301)),   # Should be fine
+    (4096, range(200, 501)),   # Might be too long for some servers
+    (8192, range(400, 501)),   # Probably too long for most servers
+)
+
+# Characters that should be rejected even when percent-encoded
+DEFINITELY_INVALID_SEGMENTS = (
+    ('%00', 'null byte'),  # Your server specifically rejects this
+)
+
+# (char, encoded, description) for characters that should be properly percent-encoded
+SHOULD_BE_ENCODED_SEGMENTS = (
+    (' ', '%20', 'space'),
+    ('<', '%3C', 'less than'),
+    ('>', '%3E', 'greater than'),
+    ('"', '%22', 'double quote'),
+)
 
 class URITests(TestCase):
     """Tests URI handling according to HTTP/1.1 specifications."""
     
-    def setup(self):
-        """Set up test environment for URI tests."""
+    def setup_suite(self):
+        """Set up the fixture tree and connection state shared by all URI tests."""
+        # No test modifies the fixture files, so they are written once per suite
+        # rather than recreated around every test
         self.test_dir = resolve_path('data/www/uri_tests')
+        self._graveyard_dir = resolve_path(GRAVEYARD_DIR)
+        self._clear_graveyard()
+        # The test directory joined once with a trailing separator; paths under
+        # it are plain concatenations of their relative components
+        self._root = os.path.join(self.test_dir, '')
         self.ensure_test_directories()
         self.create_test_files()
         
-    def teardown(self):
-        """Clean up test environment after URI tests."""
-        # Clean up all test files and directories created during testing
-        if hasattr(self, 'test_dir') and os.path.exists(self.test_dir):
-            for attempt in range(3):
-                try:
-                    shutil.rmtree(self.test_dir)
-                    self.logger.debug(f"Successfully cleaned up test directory: {self.test_dir}")
-                    break
-                except Exception as e:
-                    self.logger.debug(f"Error cleaning up test directory (attempt {attempt+1}): {e}")
-                    time.sleep(0.2)
-            else:
-                # Fallback: try to remove files/dirs individually
-                for root, dirs, files in os.walk(self.test_dir, topdown=False):
-                    for name in files:
-                        file_path = os.path.join(root, name)
-                        try:
-                            os.remove(file_path)
-                        except Exception as e:
-                            self.logger.debug(f"Fallback error removing file {file_path}: {e}")
-                    for name in dirs:
-                        dir_path = os.path.join(root, name)
-                        try:
-                            os.rmdir(dir_path)
-                        except Exception as e:
-                            self.logger.debug(f"Fallback error removing dir {dir_path}: {e}")
-                try:
-                    os.rmdir(self.test_dir)
-                except Exception as e:
-                    self.logger.debug(f"Fallback error removing test_dir {self.test_dir}: {e}")
+        # One keep-alive session for the whole suite so each URI check reuses
+        # a pooled connection instead of reconnecting
+        self.open_session(pool_maxsize=16)
         
-        # Clean up any specific test files outside the main test directory
-        for path in ['data/www/uri_tests/no_index', 'data/www/uri_tests/trailingslash', 'data/www/uri_tests/trailingslash.html']:
-            full_path = resolve_path(path)
-            if os.path.exists(full_path):
+        # Independent URI checks are sent concurrently so their round trips overlap
+        self._pool = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+    
+    def teardown_suite(self):
+        """Shut down the shared worker pool and session and remove the fixture tree."""
+        self._pool.shutdown(wait=True)
+        self.session.close()
+        
+        # Clean up all test files and directories created during testing. The
+        # tree is renamed aside in one atomic step and deleted on a background
+        # thread; it is not a daemon, so the interpreter still waits for it at exit
+        graveyard = os.path.join(self._graveyard_dir,
+                                 f'uri_tests.{os.getpid()}.{time.monotonic_ns()}')
+        try:
+            os.makedirs(self._graveyard_dir, exist_ok=True)
+            os.replace(self.test_dir, graveyard)
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            # Could not move it aside; remove it in place before returning so a
+            # later setup_suite does not race the delete
+            self.logger.debug(f"Error moving test directory aside, removing in place: {e}")
+            self._remove_tree(self.test_dir)
+            return
+        threading.Thread(target=self._remove_tree, args=(graveyard,)).start()
+    
+    def _clear_graveyard(self):
+        """Remove trees earlier runs moved aside but never finished deleting."""
+        try:
+            entries = os.listdir(self._graveyard_dir)
+        except FileNotFoundError:
+            return
+        # Trees from this process may still be in the middle of their
+        # background delete
+        own_prefix = f'uri_tests.{os.getpid()}.'
+        for name in entries:
+            if not name.startswith(own_prefix):
+                self._remove_tree(os.path.join(self._graveyard_dir, name))
+    
+    def _remove_tree(self, path):
+        """
+        Remove a directory tree, making anything it trips over writable first.
+        
+        Args:
+            path (str): Directory to remove
+        """
+        try:
+            shutil.rmtree(path, **{RMTREE_ERROR_HANDLER: _chmod_and_retry})
+            self.logger.debug(f"Successfully cleaned up test directory: {path}")
+        except Exception as e:
+            self.logger.debug(f"Error removing test directory {path}: {e}")
+    
+    def teardown(self):
+        """Remove the files and directories individual tests add to the fixture tree."""
+        for name in URI_TRANSIENT_ENTRIES:
+            full_path = self._root + name
+            try:
+                shutil.rmtree(full_path)
+            except NotADirectoryError:
                 try:
-                    if os.path.isdir(full_path):
-                        shutil.rmtree(full_path)
-                    else:
-                        os.remove(full_path)
+                    os.remove(full_path)
+                except FileNotFoundError:
+                    pass
                 except Exception as e:
                     self.logger.debug(f"Error cleaning up {full_path}: {e}")
+            except FileNotFoundError:
+                # Most tests never create this entry
+                pass
+            except Exception as e:
+                self.logger.debug(f"Error cleaning up {full_path}: {e}")
     
     def ensure_test_directories(self):
         """Create necessary directories for testing URI handling."""
-        # Create main test directory if it doesn't exist
-        os.makedirs(self.test_dir, exist_ok=True)
-        
-        # Create nested directories for path testing
-        os.makedirs(os.path.join(self.test_dir, 'a', 'b', 'c'), exist_ok=True)
-        os.makedirs(os.path.join(self.test_dir, 'docs', 'files'), exist_ok=True)
-        os.makedirs(os.path.join(self.test_dir, 'UPPERCASE'), exist_ok=True)
-        os.makedirs(os.path.join(self.test_dir, 'with spaces'), exist_ok=True)
-        os.makedirs(os.path.join(self.test_dir, 'special+chars'), exist_ok=True)
+        # Create nested directories for path testing; makedirs also creates
+        # the main test directory on the way
+        for subdir in URI_TEST_DIRS:
+            os.makedirs(self._root + subdir, exist_ok=True)
         
     def create_test_files(self):
         """Create test files for URI tests."""
-        # Create test file in root directory
-        with open(os.path.join(self.test_dir, 'test.html'), 'w') as f:
-            f.write("<!DOCTYPE html>\n<html><body><h1>URI Test File</h1><p>Root directory test file</p></body></html>")
-        
-        # Create test files in nested directories
-        with open(os.path.join(self.test_dir, 'a', 'test.html'), 'w') as f:
-            f.write("<!DOCTYPE html>\n<html><body><h1>URI Test File</h1><p>Directory A test file</p></body></html>")
-        
-        with open(os.path.join(self.test_dir, 'a', 'b', 'test.html'), 'w') as f:
-            f.write("<!DOCTYPE html>\n<html><body><h1>URI Test File</h1><p>Directory A/B test file</p></body></html>")
-        
-        with open(os.path.join(self.test_dir, 'a', 'b', 'c', 'test.html'), 'w') as f:
-            f.write("<!DOCTYPE html>\n<html><body><h1>URI Test File</h1><p>Directory A/B/C test file</p></body></html>")
-        
-        # Create index files for directory testing
-        with open(os.path.join(self.test_dir, 'index.html'), 'w') as f:
-            f.write("<!DOCTYPE html>\n<html><body><h1>Index File</h1><p>Root directory index</p></body></html>")
-        
-        with open(os.path.join(self.test_dir, 'a', 'index.html'), 'w') as f:
-            f.write("<!DOCTYPE html>\n<html><body><h1>Index File</h1><p>Directory A index</p></body></html>")
-        
-        # Create files with special characters in names
-        with open(os.path.join(self.test_dir, 'with spaces', 'file with spaces.html'), 'w') as f:
-            f.write("<!DOCTYPE html>\n<html><body><h1>File With Spaces</h1></body></html>")
-        
-        with open(os.path.join(self.test_dir, 'special+chars', 'file+with+plus.html'), 'w') as f:
-            f.write("<!DOCTYPE html>\n<html><body><h1>File With Plus Signs</h1></body></html>")
-        
-        # Create a file with mixed case name
-        with open(os.path.join(self.test_dir, 'MixedCase.html'), 'w') as f:
-            f.write("<!DOCTYPE html>\n<html><body><h1>Mixed Case Filename</h1></body></html>")
-        
-        # Create a file in the UPPERCASE directory
-        with open(os.path.join(self.test_dir, 'UPPERCASE', 'FILE.html'), 'w') as f:
-            f.write("<!DOCTYPE html>\n<html><body><h1>UPPERCASE FILE</h1></body></html>")
+        # Each file is one binary write of pre-rendered bytes; the writes are
+        # independent, so overlap them
+        with ThreadPoolExecutor(max_workers=FIXTURE_WORKERS) as executor:
+            list(executor.map(lambda item: _write_fixture(self._root + item[0], item[1]),
+                              URI_TEST_FILES))
 
     def test_uri_path_normalization(self):
         """
@@ -136,35 +386,19 @@ class URITests(TestCase):
         - Double dot segments (../): should remove the previous segment
         - Multiple consecutive slashes (//): should be normalized to a single slash
         """
-        # Base path to the URI test directory
-        base_uri = '/uri_tests'
+        results = self._send_all(self._pool, [('GET', path, {}) for path, _ in NORMALIZATION_CASES])
         
-        # Test cases with expected normalized paths
-        test_cases = [
-            # path, expected path component in response
-            (f'{base_uri}/a/./test.html', 'Directory A test file'),
-            (f'{base_uri}/a/b/../test.html', 'Directory A test file'),
-            (f'{base_uri}/a/b/c/../../test.html', 'Directory A test file'),
-            (f'{base_uri}/a/./b/./c/./test.html', 'Directory A/B/C test file'),
-            (f'{base_uri}/a//b///c////test.html', 'Directory A/B/C test file'),
-            (f'{base_uri}/./a/./b/./c/./test.html', 'Directory A/B/C test file'),
-            (f'{base_uri}/../uri_tests/a/test.html', 'Directory A test file'),
-        ]
-        
-        for path, expected_content in test_cases:
-            try:
-                response = self.runner.send_request('GET', path)
-                
-                # Check if the server normalized the path correctly
-                self.assert_equals(response.status_code, 200, 
-                                  f"Failed to normalize URI path: {path}")
-                
-                # Verify the correct file was served
-                self.assert_true(expected_content in response.text, 
-                                f"Incorrect content for normalized path: {path}")
-                
-            except requests.RequestException as e:
-                self.assert_true(False, f"Request failed for path {path}: {e}")
+        for (path, expected_content), (response, error) in zip(NORMALIZATION_CASES, results):
+            if error is not None:
+                self.assert_true(False, f"Request failed for path {path}: {error}")
+            
+            # Check if the server normalized the path correctly
+            self.assert_equals(response.status_code, 200, 
+                              f"Failed to normalize URI path: {path}")
+            
+            # Verify the correct file was served
+            self.assert_true(expected_content in response.content[:BODY_CHECK_BYTES], 
+                            f"Incorrect content for normalized path: {path}")
 
     def test_uri_path_traversal_prevention(self):
         """
@@ -173,30 +407,19 @@ class URITests(TestCase):
         Verifies that the server prevents access to files outside the document root
         by using path traversal sequences (../).
         """
-        # Attempt to access files outside the document root
-        traversal_attempts = [
-            '/uri_tests/../../../etc/passwd',
-            '/../../../etc/passwd',
-            '/uri_tests/..%2f..%2f..%2fetc/passwd',  # URL-encoded "../"
-            '/uri_tests/%2e%2e/%2e%2e/%2e%2e/etc/passwd',  # URL-encoded "../"
-            '/uri_tests/a/b/c/../../../../etc/passwd',
-            '/%2e%2e/%2e%2e/%2e%2e/etc/passwd',  # URL-encoded "../"
-        ]
+        results = self._send_all(self._pool, [('GET', path, {}) for path in TRAVERSAL_ATTEMPTS])
         
-        for path in traversal_attempts:
-            try:
-                response = self.runner.send_request('GET', path)
-                
-                # The server should either return 403 Forbidden or 404 Not Found
-                self.assert_true(response.status_code in [403, 404], 
-                                f"Path traversal not prevented for: {path}, got {response.status_code}")
-                
-                # Make sure we didn't get the actual file content
-                self.assert_false('root:' in response.text, 
-                                 f"Path traversal succeeded for: {path}")
-                
-            except requests.RequestException as e:
-                self.assert_true(False, f"Request failed for path {path}: {e}")
+        for path, (response, error) in zip(TRAVERSAL_ATTEMPTS, results):
+            if error is not None:
+                self.assert_true(False, f"Request failed for path {path}: {error}")
+            
+            # The server should either return 403 Forbidden or 404 Not Found
+            self.assert_true(response.status_code in [403, 404], 
+                            f"Path traversal not prevented for: {path}, got {response.status_code}")
+            
+            # Make sure we didn't get the actual file content
+            self.assert_false('root:' in response.text, 
+                             f"Path traversal succeeded for: {path}")
 
     def test_uri_encoding_decoding(self):
         """
@@ -205,49 +428,20 @@ class URITests(TestCase):
         Verifies that the server correctly decodes percent-encoded characters in URIs
         and serves the appropriate resources.
         """
-        # Create a set of test cases with different encodings
-        test_cases = [
-            # (path, encoded_path, expected_status_code)
-            ('/uri_tests/with spaces/file with spaces.html', 
-             '/uri_tests/with%20spaces/file%20with%20spaces.html', 200),
-            
-            ('/uri_tests/special+chars/file+with+plus.html', 
-             '/uri_tests/special%2Bchars/file%2Bwith%2Bplus.html', 200),
-            
-            # Test some special ASCII characters
-            ('/uri_tests/test.html', '/uri_tests/test%2Ehtml', 200),  # %2E = .
-            
-            # Test encoded slash
-            ('/uri_tests%2Ftest.html', None, 404),  # %2F = / (should be different resource)
-            
-            # Test various encoded characters
-            ('/uri_tests/test%41.html', None, 404),  # %41 = A
-            ('/uri_tests/test%7a.html', None, 404),  # %7a = z
-            
-            # Test a complex encoded path
-            ('/uri_tests/with%20spaces/file%20with%20spaces.html', None, 200),
-        ]
+        results = self._send_all(self._pool, [('GET', path, {}) for path, _ in ENCODING_PATHS])
         
-        for original_path, encoded_path, expected_status in test_cases:
-            paths_to_test = [original_path]
-            if encoded_path:
-                paths_to_test.append(encoded_path)
+        for (path, expected_status), (response, error) in zip(ENCODING_PATHS, results):
+            if error is not None:
+                self.assert_true(False, f"Request failed for encoded path {path}: {error}")
             
-            for path in paths_to_test:
-                try:
-                    response = self.runner.send_request('GET', path)
-                    
-                    # Check status code
-                    self.assert_equals(response.status_code, expected_status, 
-                                      f"Unexpected status for encoded path: {path}")
-                    
-                    # For 200 responses, verify we got the right content
-                    if expected_status == 200:
-                        self.assert_true('<html>' in response.text, 
-                                        f"Invalid content for encoded path: {path}")
-                    
-                except requests.RequestException as e:
-                    self.assert_true(False, f"Request failed for encoded path {path}: {e}")
+            # Check status code
+            self.assert_equals(response.status_code, expected_status, 
+                              f"Unexpected status for encoded path: {path}")
+            
+            # For 200 responses, verify we got the right content
+            if expected_status == 200:
+                self.assert_true(HTML_MARKER in response.content[:BODY_CHECK_BYTES], 
+                                f"Invalid content for encoded path: {path}")
 
     def test_uri_path_mapping(self):
         """
@@ -256,29 +450,19 @@ class URITests(TestCase):
         Verifies that the server correctly maps URI paths to filesystem paths
         based on the configuration.
         """
-        # Test various URI paths and verify they map to the correct filesystem resources
-        test_cases = [
-            # (uri, content_check)
-            ('/uri_tests/test.html', 'Root directory test file'),
-            ('/uri_tests/a/test.html', 'Directory A test file'),
-            ('/uri_tests/a/b/test.html', 'Directory A/B test file'),
-            ('/uri_tests/a/b/c/test.html', 'Directory A/B/C test file'),
-        ]
+        results = self._send_all(self._pool, [('GET', uri, {}) for uri, _ in PATH_MAPPING_CASES])
         
-        for uri, content_check in test_cases:
-            try:
-                response = self.runner.send_request('GET', uri)
-                
-                # Check status code
-                self.assert_equals(response.status_code, 200, 
-                                  f"Failed to map URI to filesystem path: {uri}")
-                
-                # Verify the correct file was served
-                self.assert_true(content_check in response.text, 
-                                f"Incorrect content for URI: {uri}")
-                
-            except requests.RequestException as e:
-                self.assert_true(False, f"Request failed for URI {uri}: {e}")
+        for (uri, content_check), (response, error) in zip(PATH_MAPPING_CASES, results):
+            if error is not None:
+                self.assert_true(False, f"Request failed for URI {uri}: {error}")
+            
+            # Check status code
+            self.assert_equals(response.status_code, 200, 
+                              f"Failed to map URI to filesystem path: {uri}")
+            
+            # Verify the correct file was served
+            self.assert_true(content_check in response.content[:BODY_CHECK_BYTES], 
+                            f"Incorrect content for URI: {uri}")
 
     def test_uri_default_document_resolution(self):
         """
@@ -287,23 +471,16 @@ class URITests(TestCase):
         Verifies that when a URI points to a directory, the server serves the
         configured default document (typically index.html).
         """
-        # Test directory URIs that should resolve to index files
-        test_cases = [
-            # (uri, content_check)
-            ('/uri_tests/', 'Root directory index'),
-            ('/uri_tests/a/', 'Directory A index'),
-        ]
-        
-        for uri, content_check in test_cases:
+        for uri, content_check in DEFAULT_DOCUMENT_CASES:
             try:
-                response = self.runner.send_request('GET', uri)
+                response = self._request('GET', uri)
                 
                 # Check status code
                 self.assert_equals(response.status_code, 200, 
                                   f"Failed to resolve default document for: {uri}")
                 
                 # Verify the correct index file was served
-                self.assert_true(content_check in response.text, 
+                self.assert_true(content_check in response.content[:BODY_CHECK_BYTES], 
                                 f"Incorrect default document for: {uri}")
                 
             except requests.RequestException as e:
@@ -317,19 +494,19 @@ class URITests(TestCase):
         where autoindex is enabled and no index file exists.
         """
         # Create a new directory without an index file
-        no_index_dir = os.path.join(self.test_dir, 'no_index')
+        no_index_dir = self._root + 'no_index'
         os.makedirs(no_index_dir, exist_ok=True)
         
         # Create some files in the directory
         for i in range(3):
-            with open(os.path.join(no_index_dir, f'file{i}.html'), 'w') as f:
-                f.write(f"<!DOCTYPE html>\n<html><body><h1>File {i}</h1></body></html>")
+            with open(os.path.join(no_index_dir, f'file{i}.html'), 'wb') as f:
+                f.write(_page(f'File {i}'))
         
         # Test the URI that should trigger a directory listing
         uri = '/uri_tests/no_index/'
         
         try:
-            response = self.runner.send_request('GET', uri)
+            response = self._request('GET', uri)
             
             # Directory listing could return 200 OK or 403 Forbidden depending on configuration
             self.assert_true(response.status_code in [200, 403], 
@@ -337,24 +514,9 @@ class URITests(TestCase):
             
             # If directory listing is enabled (200 OK), check for listing indicators
             if response.status_code == 200:
-                # Check for common directory listing indicators
-                directory_indicators = [
-                    'Index of',
-                    'Directory listing',
-                    'Parent Directory',
-                    '<dir',
-                    '<directory',
-                    'file0.html',
-                    'file1.html',
-                    'file2.html'
-                ]
-                
-                # At least one of these indicators should be present
-                found_indicator = False
-                for indicator in directory_indicators:
-                    if indicator.lower() in response.text.lower():
-                        found_indicator = True
-                        break
+                # At least one common directory listing indicator should be present
+                body = response.text.lower()
+                found_indicator = any(indicator in body for indicator in DIR_LISTING_INDICATORS)
                 
                 self.assert_true(found_indicator, 
                                 f"Directory listing not found for: {uri}")
@@ -368,29 +530,20 @@ class URITests(TestCase):
         
         Verifies that the server normalizes consecutive slashes in URIs.
         """
-        # Test cases with multiple consecutive slashes
-        test_cases = [
-            # (uri, expected_status)
-            ('/uri_tests//test.html', 200),
-            ('/uri_tests///test.html', 200),
-            ('/uri_tests//a///b////c/////test.html', 200),
-        ]
+        results = self._send_all(self._pool, [('GET', uri, {}) for uri, _ in MULTIPLE_SLASH_CASES])
         
-        for uri, expected_status in test_cases:
-            try:
-                response = self.runner.send_request('GET', uri)
-                
-                # Check status code
-                self.assert_equals(response.status_code, expected_status, 
-                                f"Unexpected status for multiple slashes: {uri}")
-                
-                # For successful responses, verify content
-                if expected_status == 200:
-                    self.assert_true('<html>' in response.text, 
-                                    f"Invalid content for URI with multiple slashes: {uri}")
-                
-            except requests.RequestException as e:
-                self.assert_true(False, f"Request failed for URI {uri}: {e}")
+        for (uri, expected_status), (response, error) in zip(MULTIPLE_SLASH_CASES, results):
+            if error is not None:
+                self.assert_true(False, f"Request failed for URI {uri}: {error}")
+            
+            # Check status code
+            self.assert_equals(response.status_code, expected_status, 
+                            f"Unexpected status for multiple slashes: {uri}")
+            
+            # For successful responses, verify content
+            if expected_status == 200:
+                self.assert_true(HTML_MARKER in response.content[:BODY_CHECK_BYTES], 
+                                f"Invalid content for URI with multiple slashes: {uri}")
                 
     def test_relative_vs_absolute_uris(self):
         """
@@ -412,11 +565,11 @@ class URITests(TestCase):
         
         for uri, expected_status in test_cases:
             try:
-                # For absolute URIs, use requests directly instead of the runner
+                # Absolute URIs already carry the host, so send them as they are
                 if uri.startswith('http'):
-                    response = requests.get(uri, timeout=self.runner.timeout)
+                    response = self.session.get(uri, timeout=self.runner.timeout)
                 else:
-                    response = self.runner.send_request('GET', uri)
+                    response = self._request('GET', uri)
                 
                 # Check status code
                 self.assert_equals(response.status_code, expected_status, 
@@ -424,7 +577,7 @@ class URITests(TestCase):
                 
                 # For successful responses, verify content
                 if expected_status == 200:
-                    self.assert_true('<html>' in response.text, 
+                    self.assert_true(HTML_MARKER in response.content[:BODY_CHECK_BYTES], 
                                     f"Invalid content for URI: {uri}")
                 
             except requests.RequestException as e:
@@ -439,28 +592,28 @@ class URITests(TestCase):
         """
         # Create a test file and directory with the same name
         dirname = 'trailingslash'
-        os.makedirs(os.path.join(self.test_dir, dirname), exist_ok=True)
+        os.makedirs(self._root + dirname, exist_ok=True)
         
         # Create a file with the same name as the directory
-        with open(os.path.join(self.test_dir, f'{dirname}.html'), 'w') as f:
-            f.write("<!DOCTYPE html>\n<html><body><h1>File</h1><p>This is a file</p></body></html>")
+        with open(self._root + f'{dirname}.html', 'wb') as f:
+            f.write(_page('File', 'This is a file'))
         
         # Create an index file in the directory
-        with open(os.path.join(self.test_dir, dirname, 'index.html'), 'w') as f:
-            f.write("<!DOCTYPE html>\n<html><body><h1>Directory</h1><p>This is a directory index</p></body></html>")
+        with open(self._root + f'{dirname}/index.html', 'wb') as f:
+            f.write(_page('Directory', 'This is a directory index'))
         
         # Test URIs with and without trailing slashes
         test_cases = [
             # (uri, content_check, redirect_expected)
-            (f'/uri_tests/{dirname}', 'Directory', True),  # May redirect to /uri_tests/{dirname}/
-            (f'/uri_tests/{dirname}/', 'Directory', False),  # Should serve the directory index
-            (f'/uri_tests/{dirname}.html', 'File', False),  # Should serve the file
+            (f'/uri_tests/{dirname}', b'Directory', True),  # May redirect to /uri_tests/{dirname}/
+            (f'/uri_tests/{dirname}/', b'Directory', False),  # Should serve the directory index
+            (f'/uri_tests/{dirname}.html', b'File', False),  # Should serve the file
         ]
         
         for uri, content_check, redirect_expected in test_cases:
             try:
                 # First test without following redirects
-                response = self.runner.send_request('GET', uri, allow_redirects=False)
+                response = self._request('GET', uri, allow_redirects=False)
                 
                 # If a redirect is expected, check for it
                 if redirect_expected and response.status_code in [301, 302, 303, 307, 308]:
@@ -473,14 +626,14 @@ class URITests(TestCase):
                                     f"Redirect location should end with /: {location}")
                     
                     # Now follow the redirect
-                    response = self.runner.send_request('GET', uri, allow_redirects=True)
+                    response = self._request('GET', uri, allow_redirects=True)
                     
                 # Check status code (after possible redirect)
                 self.assert_equals(response.status_code, 200, 
                                   f"Unexpected status for URI: {uri}")
                 
                 # Verify the correct content was served
-                self.assert_true(content_check in response.text, 
+                self.assert_true(content_check in response.content[:BODY_CHECK_BYTES], 
                                 f"Incorrect content for URI: {uri}")
                 
             except requests.RequestException as e:
@@ -494,19 +647,9 @@ class URITests(TestCase):
         According to the RFC, the scheme and host components are case-insensitive,
         while the path is case-sensitive.
         """
-        # Create test cases with different cases
-        test_cases = [
-            # (uri, expected_status)
-            ('/uri_tests/MixedCase.html', 200),  # Original case
-            ('/uri_tests/mixedcase.html', None),  # Lowercase
-            ('/uri_tests/MIXEDCASE.html', None),  # Uppercase
-            ('/uri_tests/UPPERCASE/FILE.html', 200),  # Original case
-            ('/uri_tests/uppercase/file.html', None),  # Lowercase
-        ]
-        
-        for uri, expected_status in test_cases:
+        for uri, expected_status in CASE_SENSITIVITY_CASES:
             try:
-                response = self.runner.send_request('GET', uri)
+                response = self._request('GET', uri)
                 
                 # If expected_status is None, we accept whatever the server does
                 # (Some servers are case-sensitive, others are case-insensitive)
@@ -529,24 +672,16 @@ class URITests(TestCase):
         
         Verifies that the server correctly handles (or rejects) extremely long URIs.
         """
-        # Create test cases with increasingly long URIs
-        test_cases = [
-            # (uri_length, expected_status_range)
-            (512, range(200, 301)),    # Should be fine
-            (1024, range(200, 301)),   # Should be fine
-            (4096, range(200, 501)),   # Might be too long for some servers
-            (8192, range(400, 501)),   # Probably too long for most servers
-        ]
-        
-        for length, status_range in test_cases:
-            # Generate a random string of the specified length
-            random_str = ''.join(random.choices(string.ascii_letters + string.digits, k=length))
+        for length, status_range in LONG_URI_CASES:
+            # Generate a random string of the specified length; the URL-safe base64
+            # alphabet is all unreserved characters, so it needs no escaping
+            random_str = base64.urlsafe_b64encode(os.urandom(length)).decode('ascii')[:length]
             
             # Create a long URI with random query parameters
             uri = f'/uri_tests/test.html?q={random_str}'
             
             try:
-                response = self.runner.send_request('GET', uri)
+                response = self._request('GET', uri)
                 
                 # Check status code is in the expected range
                 self.assert_true(response.status_code in status_range, 
@@ -565,40 +700,29 @@ class URITests(TestCase):
         Test validation of URI path segments according to RFC 3986 Section 2.2.
         """
         # Test 1: Characters that should be rejected even when percent-encoded
-        definitely_invalid = [
-            ('%00', 'null byte'),  # Your server specifically rejects this
-        ]
-        
-        for encoded_char, description in definitely_invalid:
+        for encoded_char, description in DEFINITELY_INVALID_SEGMENTS:
             uri = f'/uri_tests/test{encoded_char}.html'
             
             try:
-                response = self.runner.send_request('GET', uri)
+                response = self._request('GET', uri)
                 self.assert_equals(response.status_code, 400, 
                                 f"Server should reject {description}, got {response.status_code}")
             except requests.RequestException as e:
                 self.assert_true(False, f"Request failed for {description}: {e}")
         
         # Test 2: Characters that should be properly percent-encoded (and accepted)
-        should_be_encoded = [
-            (' ', '%20', 'space'),
-            ('<', '%3C', 'less than'),
-            ('>', '%3E', 'greater than'),
-            ('"', '%22', 'double quote'),
-        ]
-        
-        for char, encoded, description in should_be_encoded:
+        for char, encoded, description in SHOULD_BE_ENCODED_SEGMENTS:
             # Create a temporary test file
-            test_filename = f'test_encoded_{description.replace(" ", "_")}.html'
-            test_file_path = os.path.join(self.test_dir, test_filename)
+            test_filename = f'test_encoded_{description.translate(DESCRIPTION_TO_FILENAME)}.html'
+            test_file_path = self._root + test_filename
             
-            with open(test_file_path, 'w') as f:
-                f.write(f"<!DOCTYPE html>\n<html><body><h1>Test {description}</h1></body></html>")
+            with open(test_file_path, 'wb') as f:
+                f.write(_page(f'Test {description}'))
             
             try:
                 # Properly encoded version should work
-                encoded_uri = f'/uri_tests/{test_filename.replace(" ", "%20")}'
-                response = self.runner.send_request('GET', encoded_uri)
+                encoded_uri = f'/uri_tests/{test_filename.translate(ENCODE_SPACES)}'
+                response = self._request('GET', encoded_uri)
                 
                 # Should either find the file (200) or not find it (404), but not return 400
                 self.assert_true(response.status_code in [200, 404], 
@@ -608,5 +732,7 @@ class URITests(TestCase):
                 self.assert_true(False, f"Request failed for encoded {description}: {e}")
             finally:
                 # Clean up
-                if os.path.exists(test_file_path):
-                    os.remove(test_file_path)
\ No newline at end of file
+                try:
+                    os.remove(test_file_path)
+                except FileNotFoundError:
+                    pass
\ No newline at end of file